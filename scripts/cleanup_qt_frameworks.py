@@ -4,11 +4,30 @@ Post-build script to remove unnecessary Qt frameworks from macOS app bundle.
 This script runs after PyInstaller finishes to reduce the final app size.
 """
 
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+def _iter_files(root):
+    """Yield a DirEntry for every regular file under root, skipping symlinks."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _dir_size(path):
+    """Return the total size in bytes of all regular files under path."""
+    return sum(entry.stat(follow_symlinks=False).st_size for entry in _iter_files(path))
+
+
 def cleanup_qt_frameworks(app_name="Universal DJ USB"):
     """Remove unwanted Qt frameworks after the app bundle is created."""
     
@@ -55,19 +74,24 @@ def cleanup_qt_frameworks(app_name="Universal DJ USB"):
     
     print(f"\nRemoving {len(frameworks_to_remove)} Qt frameworks...")
     
+    paths_to_remove = []
     for framework_name in frameworks_to_remove:
         framework_path = qt_frameworks_path / framework_name
         if framework_path.exists():
             # Calculate size before removal
-            size_before = sum(f.stat().st_size for f in framework_path.rglob('*') if f.is_file())
+            size_before = _dir_size(framework_path)
             total_size_saved += size_before
             
             print(f"  Removing {framework_name} ({size_before / 1024 / 1024:.1f} MB)")
-            shutil.rmtree(framework_path)
-            removed_count += 1
+            paths_to_remove.append(framework_path)
         else:
             print(f"  {framework_name} not found (already excluded)")
     
+    # Frameworks are disjoint subtrees, so they can be deleted concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in executor.map(shutil.rmtree, paths_to_remove):
+            removed_count += 1
+    
     # Show remaining frameworks
     remaining_frameworks = [f.name for f in qt_frameworks_path.glob("Qt*.framework")]
     print(f"\nRemaining Qt frameworks: {len(remaining_frameworks)}")
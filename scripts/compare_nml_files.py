@@ -10,9 +10,6 @@ def analyze_file(filepath: Path) -> dict:
     with open(filepath, "rb") as f:
         raw_bytes = f.read()
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
-
     analysis = {
         "file_size": len(raw_bytes),
         "has_bom": raw_bytes.startswith(b"\xef\xbb\xbf"),
@@ -21,12 +18,12 @@ def analyze_file(filepath: Path) -> dict:
         "permissions": oct(filepath.stat().st_mode)[-3:],
     }
 
-    # Detect line endings
-    if "\r\n" in content:
+    # Detect line endings on the raw bytes (no need to decode the whole file)
+    if b"\r\n" in raw_bytes:
         analysis["line_ending_type"] = "CRLF (Windows)"
-    elif "\n" in content:
+    elif b"\n" in raw_bytes:
         analysis["line_ending_type"] = "LF (Unix/macOS)"
-    elif "\r" in content:
+    elif b"\r" in raw_bytes:
         analysis["line_ending_type"] = "CR (Old Mac)"
 
     return analysis
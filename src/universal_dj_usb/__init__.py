@@ -4,6 +4,9 @@ A tool for converting Rekordbox USB playlists to various formats including
 Traktor NML, M3U, and M3U8.
 """
 
+from typing import Any
+
+
 def _get_version() -> str:
     """Get version from pyproject.toml as source of truth, fallback to installed metadata."""
     try:
@@ -55,11 +58,34 @@ def _get_version() -> str:
     
     return "0.0.0"  # Ultimate fallback
 
-__version__ = _get_version()
+try:
+    # Written by the hatch version build hook, so installs and frozen builds
+    # don't have to locate and parse pyproject.toml on every import.
+    from ._version import __version__  # type: ignore[import-not-found]
+except ImportError:
+    __version__ = _get_version()
 __author__ = "Juan Martin"
 __email__ = "juanmartinsesali@gmail.com"
 
-from .models import Track, Playlist, PlaylistTree
-from .parser import RekordboxParser
-
 __all__ = ["Track", "Playlist", "PlaylistTree", "RekordboxParser"]
+
+# Public names are imported on first access so that importing the package
+# (e.g. for __version__ in the CLI) doesn't load the Kaitai parser.
+_LAZY_IMPORTS = {
+    "Track": ".models",
+    "Playlist": ".models",
+    "PlaylistTree": ".models",
+    "RekordboxParser": ".parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
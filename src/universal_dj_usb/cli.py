@@ -1,23 +1,33 @@
 """Command-line interface for the Universal DJ USB playlist converter."""
 
+import dataclasses
+import hashlib
+import json
 import logging
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
-from rich.progress import Progress, TaskID
-from rich.table import Table
-from rich.panel import Panel
 
 from . import __version__
-from .parser import RekordboxParser
-from .models import ConversionConfig, Playlist
-from .generators import NMLGenerator, M3UGenerator, M3U8Generator
+from .models import ConversionConfig, ConversionResult, Playlist, PlaylistTree
+
+if TYPE_CHECKING:
+    from .generators.base import BaseGenerator
+    from .parser import RekordboxParser
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "universal-dj-usb"
+)
+
 
 def setup_logging(debug: bool = False) -> None:
     """Set up logging configuration."""
@@ -41,9 +51,14 @@ def setup_logging(debug: bool = False) -> None:
 
 @click.group()
 @click.option("--debug", is_flag=True, help="Enable debug output")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Don't read or write the parsed playlist and output file caches",
+)
 @click.version_option(version=__version__, prog_name="Universal DJ USB Playlist Converter")
 @click.pass_context
-def cli(ctx: click.Context, debug: bool) -> None:
+def cli(ctx: click.Context, debug: bool, no_cache: bool) -> None:
     """Universal DJ USB Playlist Converter.
 
     Convert Rekordbox USB playlists to various formats (NML, M3U, M3U8).
@@ -51,53 +66,263 @@ def cli(ctx: click.Context, debug: bool) -> None:
     setup_logging(debug)
     ctx.ensure_object(dict)
     ctx.obj["debug"] = debug
+    ctx.obj["parser_cache"] = {}
+    ctx.obj["use_cache"] = not no_cache
+
+
+def _cache_file(pdb_path: Path) -> Path:
+    """Get the on-disk playlist cache file for a PDB file.
+
+    The package version is part of the name, so a cache written by another
+    version (with possibly different model classes) is never opened.
+    """
+    key = f"{__version__}:{pdb_path.resolve()}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.pickle"
+
+
+def _pdb_fingerprint(stat: os.stat_result) -> dict:
+    """Identify a PDB file version so stale cache entries are ignored."""
+    return {
+        "version": __version__,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "dev": stat.st_dev,
+        "ino": stat.st_ino,
+    }
+
+
+def _load_cached_tree(pdb_path: Path, fingerprint: dict) -> Optional[PlaylistTree]:
+    """Load a cached playlist tree if it was saved for this exact PDB file."""
+    try:
+        with open(_cache_file(pdb_path), "rb") as f:
+            # The header is pickled separately so a stale tree is never loaded
+            if pickle.load(f) != fingerprint:
+                return None
+            tree: PlaylistTree = pickle.load(f)
+        return tree
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        TypeError,
+        ValueError,
+    ) as e:
+        # Truncated or corrupt files, or classes that changed since the cache
+        # was written; the PDB is simply parsed again
+        logger.debug("Ignoring unreadable playlist cache for %s: %s", pdb_path, e)
+        return None
+
+
+def _save_cached_tree(
+    pdb_path: Path, fingerprint: dict, playlist_tree: PlaylistTree
+) -> None:
+    """Save a playlist tree to the on-disk cache, ignoring write errors."""
+    cache_file = _cache_file(pdb_path)
+    tmp_file = cache_file.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(fingerprint, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(playlist_tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.debug("Could not write playlist cache for %s: %s", pdb_path, e)
+
+
+def _probe_pdb(usb_path: Path) -> Optional[Tuple[Path, os.stat_result]]:
+    """Find the PDB on a USB drive, returning its path and stat in one lookup.
+
+    Same search order as RekordboxParser.find_pdb_file, but the stat result is
+    kept for the cache keys instead of checking existence and then stat'ing.
+    """
+    from .parser import PDB_RELATIVE_PATHS
+
+    for relative_path in PDB_RELATIVE_PATHS:
+        pdb_path = usb_path / relative_path
+        try:
+            return pdb_path, pdb_path.stat()
+        except OSError:
+            continue
+    return None
+
+
+def _track_file_stamp(usb_path: Path, track_path: Path) -> Optional[Tuple[int, int]]:
+    """Get (size, mtime) of a track's audio file, or None if it can't be read.
+
+    Enhancement reads tags from the audio files, so retagging a file changes
+    the output even though the PDB stays the same.
+    """
+    try:
+        stat = os.stat(os.path.join(usb_path, str(track_path).lstrip("/")))
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _output_fingerprint(
+    pdb_fingerprint: dict,
+    usb_path: Path,
+    playlist: Playlist,
+    track_stamps: List[Tuple[str, Optional[Tuple[int, int]]]],
+    generator_name: str,
+    config: ConversionConfig,
+    output_path: Path,
+) -> str:
+    """Hash everything that determines the contents of one output file.
+
+    track_stamps holds each track's path with its audio file's size and
+    mtime, in playlist order.
+    """
+    inputs = (
+        sorted(pdb_fingerprint.items()),
+        str(usb_path),
+        playlist.id,
+        playlist.name,
+        track_stamps,
+        generator_name,
+        dataclasses.astuple(config),
+        str(output_path),
+    )
+    return hashlib.blake2b(repr(inputs).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_output_manifest() -> dict:
+    """Load the fingerprints of previously written output files."""
+    try:
+        with open(CACHE_DIR / "outputs.json", "r", encoding="utf-8") as f:
+            manifest: dict = json.load(f)
+        return manifest
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.debug("Ignoring unreadable output manifest: %s", e)
+        return {}
+
+
+def _save_output_manifest(manifest: dict) -> None:
+    """Save output file fingerprints, ignoring write errors."""
+    manifest_file = CACHE_DIR / "outputs.json"
+    tmp_file = manifest_file.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_file, manifest_file)
+    except Exception as e:
+        logger.debug("Could not write output manifest: %s", e)
+
+
+def _is_output_current(manifest: dict, output_path: Path, fingerprint: str) -> bool:
+    """Check that a file was written from the same inputs and not touched since."""
+    entry = manifest.get(str(output_path))
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        stat = output_path.stat()
+    except OSError:
+        return False
+    return bool(
+        entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def _get_parsed(
+    ctx: click.Context, usb_path: Path
+) -> Optional[Tuple["RekordboxParser", PlaylistTree]]:
+    """Find and parse the PDB on a USB drive, reusing an earlier parse.
+
+    Results are cached on the context keyed by the PDB path, mtime and size,
+    so the database is parsed at most once per invocation. Unless --no-cache
+    is given, the playlist tree is also cached on disk and reused while the
+    PDB file is unchanged; the parser then only reads the PDB if tracks need
+    enhancing. Prints the reason and returns None if no database is found or
+    it fails to parse.
+    """
+    from .parser import get_parser
+
+    # Probe once per drive; a stat on a slow USB stick isn't free
+    pdb_probes = ctx.obj.setdefault("pdb_probes", {})
+    if usb_path not in pdb_probes:
+        pdb_probes[usb_path] = _probe_pdb(usb_path)
+    probe = pdb_probes[usb_path]
+    if not probe:
+        console.print("[red]✗ No Rekordbox database found[/red]")
+        return None
+
+    pdb_path, stat = probe
+    key = (str(pdb_path), stat.st_mtime_ns, stat.st_size)
+    parser_cache = ctx.obj.setdefault("parser_cache", {})
+    if key in parser_cache:
+        cached: Tuple["RekordboxParser", PlaylistTree] = parser_cache[key]
+        return cached
+
+    parser = get_parser(pdb_path, stat)
+    # Don't keep the PDB mapped (and the drive busy) after the command ends
+    ctx.call_on_close(parser.close)
+    use_cache = ctx.obj.get("use_cache", True)
+    fingerprint = _pdb_fingerprint(stat)
+    playlist_tree = _load_cached_tree(pdb_path, fingerprint) if use_cache else None
+
+    if playlist_tree is None:
+        if not parser.pdb_data and not parser.parse():
+            console.print("[red]✗ Failed to parse database[/red]")
+            return None
+        playlist_tree = parser.get_playlists(usb_path)
+        if use_cache and playlist_tree.all_playlists:
+            _save_cached_tree(pdb_path, fingerprint, playlist_tree)
+
+    parser_cache[key] = (parser, playlist_tree)
+    return parser, playlist_tree
 
 
 @cli.command()
 @click.argument("usb_path", type=click.Path(exists=True, path_type=Path))
-def detect(usb_path: Path) -> None:
+@click.pass_context
+def detect(ctx: click.Context, usb_path: Path) -> None:
     """Detect and validate Rekordbox data on USB drive."""
     console.print(f"[bold blue]Checking USB drive:[/bold blue] {usb_path}")
 
-    pdb_path = RekordboxParser.find_pdb_file(usb_path)
-    if pdb_path:
-        console.print(f"[green]✓ Found Rekordbox database:[/green] {pdb_path}")
-
-        # Try to parse and show basic info
-        parser = RekordboxParser(pdb_path)
-        if parser.parse():
-            playlist_tree = parser.get_playlists(usb_path)
-            console.print(f"[green]✓ Successfully parsed database[/green]")
-            console.print(f"Found {len(playlist_tree.all_playlists)} playlists")
-        else:
-            console.print("[red]✗ Failed to parse database[/red]")
+    parsed = _get_parsed(ctx, usb_path)
+    if not parsed:
+        return
+
+    parser, playlist_tree = parsed
+    console.print(f"[green]✓ Found Rekordbox database:[/green] {parser.pdb_path}")
+    # The database is only parsed when the on-disk playlist cache missed
+    if parser.pdb_data is None:
+        console.print(
+            "[green]✓ Loaded playlists from cache (database unchanged)[/green]"
+        )
     else:
-        console.print("[red]✗ No Rekordbox database found[/red]")
+        console.print(f"[green]✓ Successfully parsed database[/green]")
+    console.print(f"Found {len(playlist_tree.all_playlists)} playlists")
 
 
 @cli.command()
 @click.argument("usb_path", type=click.Path(exists=True, path_type=Path))
-def list_playlists(usb_path: Path) -> None:
+@click.pass_context
+def list_playlists(ctx: click.Context, usb_path: Path) -> None:
     """List all available playlists on the USB drive."""
     console.print(f"[bold blue]Listing playlists from:[/bold blue] {usb_path}")
 
-    pdb_path = RekordboxParser.find_pdb_file(usb_path)
-    if not pdb_path:
-        console.print("[red]✗ No Rekordbox database found[/red]")
+    parsed = _get_parsed(ctx, usb_path)
+    if not parsed:
         return
 
-    parser = RekordboxParser(pdb_path)
-    if not parser.parse():
-        console.print("[red]✗ Failed to parse database[/red]")
-        return
-
-    playlist_tree = parser.get_playlists(usb_path)
+    _, playlist_tree = parsed
 
     if not playlist_tree.all_playlists:
         console.print("[yellow]No playlists found[/yellow]")
         return
 
     # Create table
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("ID", style="dim", width=6)
     table.add_column("Name", style="cyan")
@@ -158,6 +383,12 @@ def list_playlists(usb_path: Path) -> None:
     default=False,
     help="Use absolute paths in M3U files instead of relative paths",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Regenerate files even if the database, track files and options are unchanged",
+)
 @click.pass_context
 def convert(
     ctx: click.Context,
@@ -169,6 +400,7 @@ def convert(
     use_format_suffix: bool,
     m3u_extended: bool,
     m3u_absolute_paths: bool,
+    force: bool,
 ) -> None:
     """Convert Rekordbox playlists to specified format(s)."""
     debug = ctx.obj.get("debug", False)
@@ -182,17 +414,11 @@ def convert(
     console.print(f"[bold blue]Format:[/bold blue] {format}")
 
     # Find and parse PDB
-    pdb_path = RekordboxParser.find_pdb_file(usb_path)
-    if not pdb_path:
-        console.print("[red]✗ No Rekordbox database found[/red]")
-        return
-
-    parser = RekordboxParser(pdb_path)
-    if not parser.parse():
-        console.print("[red]✗ Failed to parse database[/red]")
+    parsed = _get_parsed(ctx, usb_path)
+    if not parsed:
         return
 
-    playlist_tree = parser.get_playlists(usb_path)
+    parser, playlist_tree = parsed
 
     if not playlist_tree.all_playlists:
         console.print("[yellow]No playlists found[/yellow]")
@@ -202,29 +428,19 @@ def convert(
     playlists_to_convert = []
     if playlist:
         for name in playlist:
-            found_playlist = playlist_tree.get_playlist_by_name(name)
+            found_playlist = playlist_tree.by_name.get(name)
             if found_playlist:
                 playlists_to_convert.append(found_playlist)
             else:
                 console.print(f"[yellow]Warning: Playlist '{name}' not found[/yellow]")
     else:
         # Convert all playlists (excluding folders)
-        playlists_to_convert = [
-            pl
-            for pl in playlist_tree.all_playlists.values()
-            if not pl.is_folder and pl.track_count > 0
-        ]
+        playlists_to_convert = playlist_tree.convertible
 
     if not playlists_to_convert:
         console.print("[yellow]No playlists to convert[/yellow]")
         return
 
-    # Enhance tracks with file metadata only for playlists being converted
-    enhanced_playlists = []
-    for playlist_obj in playlists_to_convert:
-        enhanced_playlist = parser.enhance_playlist_tracks(playlist_obj, usb_path)
-        enhanced_playlists.append(enhanced_playlist)
-
     # Create configuration
     config = ConversionConfig(
         relative_paths=relative_paths,
@@ -234,82 +450,181 @@ def convert(
         m3u_absolute_paths=m3u_absolute_paths,
     )
 
+    from rich.progress import Progress
+
+    from .generators import create_generators, sanitize_filename
+
     # Create generators
-    generators = []
-    if format.lower() == "all":
-        generators = [NMLGenerator(config), M3UGenerator(config), M3U8Generator(config)]
-    elif format.lower() == "nml":
-        generators = [NMLGenerator(config)]
-    elif format.lower() == "m3u":
-        generators = [M3UGenerator(config)]
-    elif format.lower() == "m3u8":
-        generators = [M3U8Generator(config)]
+    generators = create_generators(config)
 
     # Convert playlists
     output.mkdir(parents=True, exist_ok=True)
-
-    with Progress() as progress:
-        task = progress.add_task(
-            "Converting playlists...", total=len(enhanced_playlists) * len(generators)
+    # Output files are remembered by absolute path, so a relative --output
+    # means the same files from any working directory
+    output_dir = output.resolve()
+
+    # Work out every output file up front; generators keep no per-call state,
+    # so the (mostly I/O bound) generate calls can run concurrently. Jobs that
+    # target the same file (playlists sharing a name) stay in one sequence so
+    # the last one still wins, as before.
+    # The filename ending only depends on the generator: the extension, with
+    # the format suffix in front of it if requested (e.g. "_nml.nml")
+    generator_endings = []
+    for generator in generators:
+        ending = generator.file_extension
+        if config.use_format_suffix:
+            # Get the format name without the dot (e.g., "nml", "m3u", "m3u8")
+            ending = f"_{ending.lstrip('.')}{ending}"
+        generator_endings.append((generator, ending))
+
+    jobs_by_path: Dict[Path, List[Tuple[int, Playlist, "BaseGenerator"]]] = {}
+    job_count = 0
+    for playlist_obj in playlists_to_convert:
+        # Construct the filename like the GUI does
+        safe_name = sanitize_filename(playlist_obj.name)
+        for generator, ending in generator_endings:
+            # Create the full output path
+            output_path = output_dir / f"{safe_name}{ending}"
+            jobs_by_path.setdefault(output_path, []).append(
+                (job_count, playlist_obj, generator)
+            )
+            job_count += 1
+
+    # Skip files written from the same PDB, playlist, track files and options
+    # that haven't been modified since. The last job for a path is the one
+    # that writes it.
+    use_cache = ctx.obj.get("use_cache", True)
+    _, pdb_stat = ctx.obj["pdb_probes"][usb_path]
+    pdb_fingerprint = _pdb_fingerprint(pdb_stat)
+    manifest = _load_output_manifest() if use_cache else {}
+    fingerprints = {}
+    stale_jobs = {}
+    # A playlist is written once per format; stat its track files only once
+    stamps_by_playlist: Dict[int, List[Tuple[str, Optional[Tuple[int, int]]]]] = {}
+    for output_path, path_jobs in jobs_by_path.items():
+        _, playlist_obj, generator = path_jobs[-1]
+        track_stamps = stamps_by_playlist.get(id(playlist_obj))
+        if track_stamps is None:
+            track_stamps = [
+                (str(track.file_path), _track_file_stamp(usb_path, track.file_path))
+                for track in playlist_obj.tracks
+            ]
+            stamps_by_playlist[id(playlist_obj)] = track_stamps
+        fingerprint = _output_fingerprint(
+            pdb_fingerprint,
+            usb_path,
+            playlist_obj,
+            track_stamps,
+            type(generator).__name__,
+            config,
+            output_path,
         )
+        fingerprints[output_path] = fingerprint
+        if force or not _is_output_current(manifest, output_path, fingerprint):
+            stale_jobs[output_path] = path_jobs
+    skipped_count = len(jobs_by_path) - len(stale_jobs)
+
+    # Enhance tracks with file metadata only for playlists being written
+    to_enhance = {
+        id(playlist_obj): playlist_obj
+        for path_jobs in stale_jobs.values()
+        for _, playlist_obj, _ in path_jobs
+    }
+    enhanced_playlists = parser.enhance_playlists_tracks(
+        list(to_enhance.values()), usb_path
+    )
+    enhanced_by_id = dict(zip(to_enhance, enhanced_playlists))
+
+    def run_jobs(
+        output_path: Path, path_jobs: List[Tuple[int, Playlist, "BaseGenerator"]]
+    ) -> List[Tuple[int, ConversionResult]]:
+        return [
+            (
+                index,
+                generator.generate(
+                    enhanced_by_id[id(playlist_obj)], output_path, usb_path
+                ),
+            )
+            for index, playlist_obj, generator in path_jobs
+        ]
 
-        results = []
-        for playlist_obj in enhanced_playlists:
-            for generator in generators:
-                # Construct the filename like the GUI does
-                filename = generator._sanitize_filename(playlist_obj.name)
+    results: List[Optional[ConversionResult]] = [None] * job_count
+    max_workers = min(32, (os.cpu_count() or 1) * 4, max(len(stale_jobs), 1))
 
-                # Add format suffix if requested (before the extension)
-                if config.use_format_suffix:
-                    # Get the format name without the dot (e.g., "nml", "m3u", "m3u8")
-                    format_name = generator.file_extension.lstrip(".")
-                    filename = f"{filename}_{format_name}"
+    # No live progress bar (or its refresh thread) when output isn't a terminal;
+    # the summary below is all that gets printed then.
+    progress = Progress(console=console, disable=not console.is_terminal)
 
-                # Add the file extension
-                filename = f"{filename}{generator.file_extension}"
+    with progress, ThreadPoolExecutor(max_workers) as executor:
+        task = progress.add_task(
+            "Converting playlists...",
+            total=sum(len(path_jobs) for path_jobs in stale_jobs.values()),
+        )
 
-                # Create the full output path
-                output_path = output / filename
+        futures = [
+            executor.submit(run_jobs, output_path, path_jobs)
+            for output_path, path_jobs in stale_jobs.items()
+        ]
 
-                result = generator.generate(playlist_obj, output_path, usb_path)
-                results.append(result)
+        # Collect results as files finish, keeping job order. Successful files
+        # are listed in the summary below, so only failures are printed while
+        # the progress bar is live.
+        for future in as_completed(futures):
+            for index, result in future.result():
+                results[index] = result
 
-                if result.success:
-                    console.print(
-                        f"[green]✓[/green] {playlist_obj.name} → {result.output_file.name}"
-                    )
-                    # Only show warnings in debug mode
-                    if debug and result.warnings:
-                        for warning in result.warnings:
-                            console.print(f"  [yellow]⚠[/yellow] {warning}")
-                else:
-                    console.print(
-                        f"[red]✗[/red] {playlist_obj.name}: {result.error_message}"
+                if not result.success:
+                    progress.console.print(
+                        f"[red]✗[/red] {result.playlist_name}: {result.error_message}"
                     )
 
                 progress.advance(task)
 
+    # Remember what each successfully written file was generated from
+    for output_path, path_jobs in stale_jobs.items():
+        last_result = results[path_jobs[-1][0]]
+        if last_result is not None and last_result.success:
+            stat = output_path.stat()
+            manifest[str(output_path)] = {
+                "fingerprint": fingerprints[output_path],
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+    if use_cache and stale_jobs:
+        _save_output_manifest(manifest)
+
+    completed = [r for r in results if r is not None]
+
     # Improved Summary
-    successful = sum(1 for r in results if r.success)
-    total = len(results)
+    successful = sum(1 for r in completed if r.success)
+    total = len(completed)
     failed = total - successful
 
     console.print()
     if successful == total:
-        console.print(
-            f"[bold green]✅ Successfully converted {successful} playlist{'s' if successful != 1 else ''}[/bold green]"
-        )
+        if total:
+            console.print(
+                f"[bold green]✅ Successfully converted {successful} playlist{'s' if successful != 1 else ''}[/bold green]"
+            )
     else:
         console.print(
             f"[yellow]⚠ Converted {successful}/{total} playlists ({failed} failed)[/yellow]"
         )
+    if skipped_count:
+        console.print(
+            f"[dim]Skipped {skipped_count} up-to-date file{'s' if skipped_count != 1 else ''} (use --force to regenerate)[/dim]"
+        )
 
     # Show basic info for each successful conversion
-    for result in results:
+    for result in completed:
         if result.success:
             console.print(
                 f"[cyan]📁 {result.playlist_name}[/cyan]: {result.track_count} tracks → {result.output_file.name}"
             )
+            # Only show warnings in debug mode
+            if debug and result.warnings:
+                for warning in result.warnings:
+                    console.print(f"  [yellow]⚠[/yellow] {warning}")
 
     console.print(f"[dim]Output directory: {output}[/dim]")
 
@@ -323,30 +638,25 @@ def convert(
         if format.lower() in ["m3u", "m3u8", "all"]:
             console.print(f"[dim]• M3U extended format: {m3u_extended}[/dim]")
             console.print(f"[dim]• M3U absolute paths: {m3u_absolute_paths}[/dim]")
-        if any(r.warnings for r in results):
+        if any(r.warnings for r in completed):
             console.print(
-                f"[dim]• Total warnings: {sum(len(r.warnings) for r in results)}[/dim]"
+                f"[dim]• Total warnings: {sum(len(r.warnings) for r in completed)}[/dim]"
             )
 
 
 @cli.command()
 @click.argument("usb_path", type=click.Path(exists=True, path_type=Path))
 @click.argument("playlist_name")
-def info(usb_path: Path, playlist_name: str) -> None:
+@click.pass_context
+def info(ctx: click.Context, usb_path: Path, playlist_name: str) -> None:
     """Get detailed information about a specific playlist."""
     console.print(f"[bold blue]Getting info for playlist:[/bold blue] {playlist_name}")
 
-    pdb_path = RekordboxParser.find_pdb_file(usb_path)
-    if not pdb_path:
-        console.print("[red]✗ No Rekordbox database found[/red]")
-        return
-
-    parser = RekordboxParser(pdb_path)
-    if not parser.parse():
-        console.print("[red]✗ Failed to parse database[/red]")
+    parsed = _get_parsed(ctx, usb_path)
+    if not parsed:
         return
 
-    playlist_tree = parser.get_playlists(usb_path)
+    _, playlist_tree = parsed
     playlist = playlist_tree.get_playlist_by_name(playlist_name)
 
     if not playlist:
@@ -365,7 +675,9 @@ def info(usb_path: Path, playlist_name: str) -> None:
 
     # Show first few tracks
     if playlist.tracks:
-        console.print("\\n[bold cyan]Sample tracks:[/bold cyan]")
+        console.print("\n[bold cyan]Sample tracks:[/bold cyan]")
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Artist", style="cyan")
         table.add_column("Title", style="green")
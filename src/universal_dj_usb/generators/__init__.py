@@ -1,8 +1,35 @@
 """Playlist format generators."""
 
-from .base import BaseGenerator
+from typing import Dict, List, Type
+
+from ..models import ConversionConfig
+from .base import BaseGenerator, sanitize_filename
 from .nml import NMLGenerator
 from .m3u import M3UGenerator
 from .m3u8 import M3U8Generator
 
-__all__ = ["BaseGenerator", "NMLGenerator", "M3UGenerator", "M3U8Generator"]
+# Generator class for each output format, in the order "all" produces them
+GENERATORS: Dict[str, Type[BaseGenerator]] = {
+    "nml": NMLGenerator,
+    "m3u": M3UGenerator,
+    "m3u8": M3U8Generator,
+}
+
+
+def create_generators(config: ConversionConfig) -> List[BaseGenerator]:
+    """Create the generators for config.output_format ("all" for every format)."""
+    if config.output_format == "all":
+        return [generator_class(config) for generator_class in GENERATORS.values()]
+    generator_class = GENERATORS.get(config.output_format)
+    return [generator_class(config)] if generator_class else []
+
+
+__all__ = [
+    "BaseGenerator",
+    "NMLGenerator",
+    "M3UGenerator",
+    "M3U8Generator",
+    "GENERATORS",
+    "create_generators",
+    "sanitize_filename",
+]
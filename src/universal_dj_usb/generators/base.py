@@ -1,18 +1,51 @@
 """Base generator class for playlist format conversion."""
 
+import os
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Set
 
 from ..models import Playlist, ConversionConfig, ConversionResult
 
+# Characters that are invalid in filenames on at least one supported platform
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+
+def sanitize_filename(name: str) -> str:
+    """Sanitize a playlist name into a cross-platform filename."""
+    # Replace invalid characters
+    name = _INVALID_FILENAME_CHARS.sub("_", name)
+
+    # Trim whitespace and dots
+    name = name.strip().strip(".")
+
+    # Ensure it's not empty
+    return name or "playlist"
+
+
+@lru_cache(maxsize=64)
+def _base_prefix(base_path: Path) -> str:
+    """Return base_path as a string ending in a path separator.
+
+    Every track of a playlist is normalized against the same base, so the
+    prefix is only built once per base rather than once per track.
+    """
+    return os.path.join(str(base_path), "")
+
 
 class BaseGenerator(ABC):
     """Base class for playlist format generators."""
 
+    # File extension for this format, e.g. ".nml"; set by each subclass
+    file_extension: str
+
     def __init__(self, config: ConversionConfig):
         """Initialize the generator with configuration."""
         self.config = config
+        # Output folders this generator already created or found
+        self._created_dirs: Set[Path] = set()
 
     @abstractmethod
     def generate(
@@ -21,35 +54,63 @@ class BaseGenerator(ABC):
         """Generate a playlist file in the specific format."""
         pass
 
-    @property
-    @abstractmethod
-    def file_extension(self) -> str:
-        """Return the file extension for this format."""
-        pass
-
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a filename for cross-platform compatibility."""
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-
-        # Trim whitespace and dots
-        name = name.strip().strip(".")
-
-        # Ensure it's not empty
-        if not name:
-            name = "playlist"
-
-        return name
+        return sanitize_filename(name)
 
     def _normalize_path(self, path: Path, base_path: Path = None) -> str:
         """Normalize file path for cross-platform compatibility."""
+        path_str = str(path)
         if base_path and self.config.relative_paths:
+            # A prefix check on the already normalized strings gives the same
+            # result as Path.relative_to without comparing part by part; paths
+            # outside base_path fall back to the absolute path as before
+            base_str = _base_prefix(base_path)
+            if path_str.startswith(base_str):
+                path_str = path_str[len(base_str) :]
+        return path_str.replace("\\", "/")
+
+    @staticmethod
+    def _usb_track_path(usb_path: Path, track_path: str) -> str:
+        """Join a PDB track path (e.g. "/Contents/a.mp3") onto the USB mount.
+
+        Same result as str(usb_path / track_path.lstrip("/")) for the plain
+        paths Rekordbox stores, without building a Path per track.
+        """
+        path = os.path.join(usb_path, track_path.lstrip("/"))
+        return path if os.sep == "/" else path.replace("/", os.sep)
+
+    def _ensure_parent(self, path: Path) -> None:
+        """Create the folder of an output file, once per folder and generator."""
+        parent = path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+
+    @staticmethod
+    def _file_exists(path: str, listings: Dict[str, Set[str]]) -> bool:
+        """Check whether a file exists, listing its folder once for all files.
+
+        listings maps folders that were already listed to their entry names;
+        pass the same dict for every track of a playlist.
+        """
+        parent, name = os.path.split(path)
+        names = listings.get(parent)
+        if names is None:
             try:
-                rel_path = path.relative_to(base_path)
-                return str(rel_path).replace("\\", "/")
-            except ValueError:
-                # Fallback to absolute path if relative fails
-                pass
-        return str(path).replace("\\", "/")
+                names = set(os.listdir(parent or "."))
+            except OSError:
+                names = set()
+            listings[parent] = names
+        # Names missing from the listing get a real check, e.g. a different
+        # case on a case-insensitive drive
+        return name in names or os.path.exists(path)
+
+    def _write(self, path: Path, content: str, encoding: str = "utf-8") -> None:
+        """Write a generated playlist file with a single write call.
+
+        Line endings are translated the same way a text-mode file would.
+        """
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        path.write_bytes(content.encode(encoding))
@@ -2,10 +2,10 @@
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .base import BaseGenerator
-from ..models import Playlist, ConversionResult
+from ..models import Playlist, Track, ConversionResult
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +13,7 @@ logger = logging.getLogger(__name__)
 class M3UGenerator(BaseGenerator):
     """Generator for M3U playlist format."""
 
-    @property
-    def file_extension(self) -> str:
-        """Return the file extension for M3U format."""
-        return ".m3u"
+    file_extension = ".m3u"
 
     def generate(
         self, playlist: Playlist, output_path: Path, usb_path: Path = None
@@ -27,47 +24,44 @@ class M3UGenerator(BaseGenerator):
             output_file = output_path
 
             # Ensure output directory exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(output_file)
 
-            lines = []
+            lines: List[str] = []
             warnings = []
 
+            # Options are fixed for the whole playlist; look them up once
+            extended = self.config.m3u_extended
+            absolute_paths = self.config.m3u_absolute_paths
+            normalize_path = self._normalize_path
+            track_info = self._track_info
+            absolute_track_path = self._absolute_track_path
+            append = lines.append
+
             # Add header if using extended format
-            if self.config.m3u_extended:
-                lines.append("#EXTM3U")
+            if extended:
+                append("#EXTM3U")
 
             for track in playlist.tracks:
                 # Add extended info if using extended format
-                if self.config.m3u_extended:
+                if extended:
                     duration = int(track.duration) if track.duration else -1
-                    track_info = f"{track.artist} - {track.title}"
-                    lines.append(f"#EXTINF:{duration},{track_info}")
+                    append(f"#EXTINF:{duration},{track_info(track)}")
 
                 # Determine path type based on M3U-specific option
-                if self.config.m3u_absolute_paths:
+                if absolute_paths:
                     # Use absolute paths - construct full system path
-                    track_path_str = str(track.file_path)
-
-                    if usb_path:
-                        # Always construct full path from USB base and track path
-                        if track_path_str.startswith("/"):
-                            track_path_str = track_path_str[1:]  # Remove leading slash
-                        full_path = usb_path / track_path_str
-                        track_path = str(full_path)
-                    else:
-                        track_path = track_path_str
+                    track_path = absolute_track_path(track, usb_path)
                 else:
                     # Use relative paths - keep the original working logic
-                    track_path = self._normalize_path(track.file_path, output_path)
+                    track_path = normalize_path(track.file_path, output_path)
 
-                lines.append(track_path)
+                append(track_path)
 
-            # Write the M3U file with appropriate encoding
+            # Write the file with appropriate encoding (UTF-8 for M3U8)
             content = "\n".join(lines)
             encoding = "ascii" if self.file_extension.endswith(".m3u") else "utf-8"
 
-            with open(output_file, "w", encoding=encoding) as f:
-                f.write(content)
+            self._write(output_file, content, encoding)
 
             return ConversionResult(
                 success=True,
@@ -81,5 +75,18 @@ class M3UGenerator(BaseGenerator):
             return ConversionResult(
                 success=False,
                 playlist_name=playlist.name,
-                error_message=f"Failed to generate M3U: {str(e)}",
+                error_message=f"Failed to generate {self.file_extension[1:].upper()}: {str(e)}",
             )
+
+    def _track_info(self, track: Track) -> str:
+        """Return the #EXTINF display text of a track."""
+        return f"{track.artist} - {track.title}"
+
+    def _absolute_track_path(self, track: Track, usb_path: Optional[Path]) -> str:
+        """Return the full system path of a track for m3u_absolute_paths."""
+        track_path_str = str(track.file_path)
+
+        if usb_path:
+            # Always construct full path from USB base and track path
+            return self._usb_track_path(usb_path, track_path_str)
+        return track_path_str
@@ -1,19 +1,58 @@
 """Traktor NML playlist generator."""
 
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import os
+import uuid
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Set
+from functools import lru_cache
 import platform
 
 from .base import BaseGenerator
 from ..models import Playlist, Track, CuePoint, ConversionResult
 
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="no"?>'
+
+
+def _escape_attr(value: str) -> str:
+    """Escape a value for a double-quoted XML attribute.
+
+    Newlines and tabs are written as character references; written raw (as
+    minidom did), XML parsers normalise them to spaces.
+    """
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+    )
+
+
+def _tag(depth: int, name: str, attribs: Dict[str, str], empty: bool = True) -> str:
+    """Format one indented NML element line.
+
+    Empty elements are written as <TAG ...></TAG>, never <TAG ... />, which
+    is what Traktor itself writes; otherwise only the start tag is returned.
+    """
+    attrs = "".join(f' {key}="{_escape_attr(value)}"' for key, value in attribs.items())
+    if empty:
+        return f"{'  ' * depth}<{name}{attrs}></{name}>"
+    return f"{'  ' * depth}<{name}{attrs}>"
+
+
+@lru_cache(maxsize=1024)
+def _traktor_directory(directory: str) -> str:
+    """Format a "/"-separated folder as a Traktor LOCATION DIR ("/:a/:b/:")."""
+    return "/:" + "/:".join(part for part in directory.split("/") if part) + "/:"
+
 
 class NMLGenerator(BaseGenerator):
     """Generator for Traktor NML playlist format."""
 
+    file_extension = ".nml"
+
     # Traktor's musical key numbering system
     # Maps ID3 tag keys (what we extract) → Traktor MUSICAL_KEY VALUE (what Traktor shows in UI)
     # Source: Real Traktor NML export comparison with UI screenshot
@@ -55,6 +94,12 @@ class NMLGenerator(BaseGenerator):
         "G#": 9,  # Same as Ab
     }
 
+    # Attributes shared by every collection ENTRY; copied per track
+    ENTRY_TEMPLATE = {
+        "MODIFIED_DATE": "2024/1/1",
+        "MODIFIED_TIME": "0",
+    }
+
     def _get_traktor_key_number(self, key_string: str) -> Optional[int]:
         """
         Convert a musical key string to Traktor's numerical system.
@@ -87,11 +132,6 @@ class NMLGenerator(BaseGenerator):
 
         return None
 
-    @property
-    def file_extension(self) -> str:
-        """Return the file extension for NML format."""
-        return ".nml"
-
     def generate(
         self, playlist: Playlist, output_path: Path, usb_path: Path = None
     ) -> ConversionResult:
@@ -101,118 +141,107 @@ class NMLGenerator(BaseGenerator):
             output_file = output_path
 
             # Ensure output directory exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(output_file)
 
             # Extract volume name from USB path
             volume_name = ""
             if usb_path:
                 if platform.system() == "Windows":
                     # On Windows, use the drive letter (e.g., "D:")
-                    backslash = '\\'
+                    backslash = "\\"
                     drive_anchor = usb_path.anchor.rstrip(backslash)
                     volume_name = drive_anchor  # e.g., "D:"
                 else:
                     # On macOS/Linux, use the volume name
                     volume_name = usb_path.name
 
-            # Create NML structure
-            nml_root = ET.Element("NML", VERSION="19")
-
-            # Add header
-            head = ET.SubElement(
-                nml_root,
-                "HEAD",
-                COMPANY="www.native-instruments.com",
-                PROGRAM="Traktor",
-            )
-
-            # Add empty MUSICFOLDERS section
-            musicfolders = ET.SubElement(nml_root, "MUSICFOLDERS")
+            # The document layout is fixed, so it is written line by line
+            # rather than built as a tree and pretty-printed afterwards
+            lines = [
+                _XML_DECLARATION,
+                '<NML VERSION="19">',
+                _tag(
+                    1,
+                    "HEAD",
+                    {"COMPANY": "www.native-instruments.com", "PROGRAM": "Traktor"},
+                ),
+                # Empty MUSICFOLDERS section
+                _tag(1, "MUSICFOLDERS", {}),
+            ]
 
             # Add collection with all tracks
-            collection = ET.SubElement(
-                nml_root, "COLLECTION", ENTRIES=str(len(playlist.tracks))
+            track_count = str(len(playlist.tracks))
+            lines.append(
+                _tag(1, "COLLECTION", {"ENTRIES": track_count}, not playlist.tracks)
             )
 
             warnings = []
+            # Folder listings for the file-not-found check, shared by all tracks
+            listings: Dict[str, Set[str]] = {}
 
             # Add all tracks to collection
             for track in playlist.tracks:
                 self._add_track_to_collection(
-                    collection, track, output_path, warnings, volume_name, usb_path
+                    lines,
+                    track,
+                    output_path,
+                    warnings,
+                    volume_name,
+                    usb_path,
+                    listings,
                 )
-
-            # Add empty SETS section
-            sets = ET.SubElement(nml_root, "SETS", ENTRIES="0")
-
-            # Add playlists section with proper structure
-            playlists = ET.SubElement(nml_root, "PLAYLISTS")
-
-            # Create root folder node
-            root_node = ET.SubElement(playlists, "NODE", TYPE="FOLDER", NAME="$ROOT")
-            root_subnodes = ET.SubElement(root_node, "SUBNODES", COUNT="1")
-
-            # Create playlist node
-            playlist_node = ET.SubElement(
-                root_subnodes, "NODE", TYPE="PLAYLIST", NAME=playlist.name
-            )
-
-            # Create playlist element with entries
-            playlist_element = ET.SubElement(
-                playlist_node,
-                "PLAYLIST",
-                ENTRIES=str(len(playlist.tracks)),
-                TYPE="LIST",
-                UUID=self._generate_uuid(),
-            )
+            if playlist.tracks:
+                lines.append("  </COLLECTION>")
+
+            # Empty SETS section, then the playlists section with a root
+            # folder node holding this playlist
+            lines += [
+                _tag(1, "SETS", {"ENTRIES": "0"}),
+                "  <PLAYLISTS>",
+                _tag(2, "NODE", {"TYPE": "FOLDER", "NAME": "$ROOT"}, False),
+                _tag(3, "SUBNODES", {"COUNT": "1"}, False),
+                _tag(4, "NODE", {"TYPE": "PLAYLIST", "NAME": playlist.name}, False),
+                _tag(
+                    5,
+                    "PLAYLIST",
+                    {
+                        "ENTRIES": track_count,
+                        "TYPE": "LIST",
+                        "UUID": self._generate_uuid(),
+                    },
+                    not playlist.tracks,
+                ),
+            ]
 
             # Add playlist entries with PRIMARYKEY structure
             for track in playlist.tracks:
-                entry = ET.SubElement(playlist_element, "ENTRY")
-                primarykey = ET.SubElement(
-                    entry,
-                    "PRIMARYKEY",
-                    TYPE="TRACK",
-                    KEY=self._generate_track_key(track, usb_path),
-                )
-
-            # Add empty INDEXING section
-            indexing = ET.SubElement(nml_root, "INDEXING")
-
-            # Format and write XML
-            xml_str = ET.tostring(nml_root, encoding="unicode")
-            dom = minidom.parseString(xml_str)
-            pretty_xml = dom.toprettyxml(indent="  ")
-
-            # Fix XML declaration to match Traktor format
-            pretty_xml = pretty_xml.replace(
-                '<?xml version="1.0" ?>',
-                '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
-            )
-
-            # Fix self-closing tags to use proper closing tags
-            import re
-
-            # Convert <TAG /> to <TAG></TAG> for ALL elements that should have closing tags
-            pretty_xml = re.sub(
-                r"<(HEAD|MUSICFOLDERS|LOCATION|ALBUM|ARTIST|TITLE|GENRE|MODIFICATION_INFO|MUSICAL_KEY|TEMPO|CUE_V2|LOUDNESS|INFO|SETS|INDEXING|PRIMARYKEY)(\s+[^>]*?)?\s*/>",
-                r"<\1\2></\1>",
-                pretty_xml,
-            )
-
-            # Additional pass to catch any remaining self-closing tags
-            pretty_xml = re.sub(
-                r"<([A-Z_]+)(\s+[^>]+?)\s*/>",
-                r"<\1\2></\1>",
-                pretty_xml,
-            )
-
-            # Remove extra blank lines
-            lines = [line for line in pretty_xml.split("\\n") if line.strip()]
-            formatted_xml = "\\n".join(lines)
-
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(formatted_xml)
+                lines += [
+                    "            <ENTRY>",
+                    _tag(
+                        7,
+                        "PRIMARYKEY",
+                        {
+                            "TYPE": "TRACK",
+                            "KEY": self._generate_track_key(track, usb_path),
+                        },
+                    ),
+                    "            </ENTRY>",
+                ]
+            if playlist.tracks:
+                lines.append("          </PLAYLIST>")
+
+            lines += [
+                "        </NODE>",
+                "      </SUBNODES>",
+                "    </NODE>",
+                "  </PLAYLISTS>",
+                # Empty INDEXING section
+                _tag(1, "INDEXING", {}),
+                "</NML>",
+            ]
+            formatted_xml = "\n".join(lines) + "\n"
+
+            self._write(output_file, formatted_xml)
 
             return ConversionResult(
                 success=True,
@@ -231,41 +260,48 @@ class NMLGenerator(BaseGenerator):
 
     def _add_track_to_collection(
         self,
-        collection: ET.Element,
+        lines: List[str],
         track: Track,
         output_path: Path,
         warnings: list,
         volume_name: str = "",
         usb_path: Path = None,
+        listings: Optional[Dict[str, Set[str]]] = None,
     ) -> None:
-        """Add a track entry to the collection."""
+        """Add a track's ENTRY element to the collection lines."""
         # Get file path
         if self.config.relative_paths:
             file_path = self._normalize_path(track.file_path, output_path)
         else:
             file_path = self._normalize_path(track.file_path)
 
-        # Convert to Traktor path format
-        traktor_path = self._format_traktor_path(file_path)
+        # Convert to Traktor path format. Tracks in the same folder share their
+        # LOCATION DIR, so it is formatted once per folder, not once per track.
+        directory, _, filename = file_path.rpartition("/")
+        if filename:
+            location_dir = _traktor_directory(directory)
+        else:
+            location_dir = self._get_directory_path(
+                self._format_traktor_path(file_path)
+            )
 
-        # Check if file exists (only add warning for debug purposes)
+        # Check if file exists (only add warning for debug purposes). The path
+        # is joined as a plain string; a Path is only built for the warning.
         if usb_path:
             # Construct proper absolute path
-            track_path_str = str(track.file_path)
-            if track_path_str.startswith("/"):
-                track_path_str = track_path_str[1:]  # Remove leading slash
-            absolute_file_path = usb_path / track_path_str
+            absolute_file_path = self._usb_track_path(usb_path, str(track.file_path))
         else:
-            absolute_file_path = track.file_path
+            absolute_file_path = str(track.file_path)
 
-        if not absolute_file_path.exists():
-            warnings.append(f"File not found: {absolute_file_path}")
+        if listings is None:
+            exists = os.path.exists(absolute_file_path)
+        else:
+            exists = self._file_exists(absolute_file_path, listings)
+        if not exists:
+            warnings.append(f"File not found: {Path(absolute_file_path)}")
 
         # Create entry element with title and artist as attributes
-        entry_attribs = {
-            "MODIFIED_DATE": "2024/1/1",
-            "MODIFIED_TIME": "0",
-        }
+        entry_attribs = self.ENTRY_TEMPLATE.copy()
 
         # Add title and artist as attributes to ENTRY
         if track.title:
@@ -273,20 +309,20 @@ class NMLGenerator(BaseGenerator):
         if track.artist:
             entry_attribs["ARTIST"] = track.artist
 
-        entry = ET.SubElement(collection, "ENTRY", **entry_attribs)
+        lines.append(_tag(2, "ENTRY", entry_attribs, False))
 
         # Location with volume information
-        location = ET.SubElement(
-            entry,
-            "LOCATION",
-            DIR=self._get_directory_path(traktor_path),
-            FILE=track.filename,
-            VOLUME=volume_name,
+        lines.append(
+            _tag(
+                3,
+                "LOCATION",
+                {"DIR": location_dir, "FILE": track.filename, "VOLUME": volume_name},
+            )
         )
 
         # Album
         if track.album:
-            ET.SubElement(entry, "ALBUM", TITLE=track.album)
+            lines.append(_tag(3, "ALBUM", {"TITLE": track.album}))
 
         # Info
         info_attribs = {
@@ -312,12 +348,16 @@ class NMLGenerator(BaseGenerator):
         if track.year:
             info_attribs["RELEASE_DATE"] = f"{track.year}/1/1"
 
-        ET.SubElement(entry, "INFO", **info_attribs)
+        lines.append(_tag(3, "INFO", info_attribs))
 
         # Tempo
         if track.bpm:
-            tempo = ET.SubElement(
-                entry, "TEMPO", BPM=f"{track.bpm:.2f}", BPM_QUALITY="100.000000"
+            lines.append(
+                _tag(
+                    3,
+                    "TEMPO",
+                    {"BPM": f"{track.bpm:.2f}", "BPM_QUALITY": "100.000000"},
+                )
             )
 
         # Musical key
@@ -330,24 +370,25 @@ class NMLGenerator(BaseGenerator):
             traktor_key_number = self._get_traktor_key_number(key_string)
             print(f"DEBUG: Traktor key number = {traktor_key_number}")  # Debug
             if traktor_key_number:
-                ET.SubElement(entry, "MUSICAL_KEY", VALUE=str(traktor_key_number))
+                lines.append(_tag(3, "MUSICAL_KEY", {"VALUE": str(traktor_key_number)}))
             else:
                 # Fallback to string value if no mapping found
-                ET.SubElement(entry, "MUSICAL_KEY", VALUE=key_string)
+                lines.append(_tag(3, "MUSICAL_KEY", {"VALUE": key_string}))
 
         # Cue points
         if self.config.include_cue_points and track.cue_points:
-            cues = ET.SubElement(entry, "CUE_V2")
+            lines.append("      <CUE_V2>")
             for i, cue in enumerate(track.cue_points):
-                self._add_cue_point(cues, cue, i)
+                self._add_cue_point(lines, cue, i)
+            lines.append("      </CUE_V2>")
 
-    def _add_playlist_entry(
-        self, subnodes: ET.Element, track: Track, index: int
-    ) -> None:
+        lines.append("    </ENTRY>")
+
+    def _add_playlist_entry(self, lines: List[str], track: Track, index: int) -> None:
         """Add a playlist entry reference."""
-        ET.SubElement(subnodes, "NODE", TYPE="TRACK", KEY=f"track_{index}")
+        lines.append(_tag(4, "NODE", {"TYPE": "TRACK", "KEY": f"track_{index}"}))
 
-    def _add_cue_point(self, cues: ET.Element, cue: CuePoint, index: int) -> None:
+    def _add_cue_point(self, lines: List[str], cue: CuePoint, index: int) -> None:
         """Add a cue point to the track."""
         cue_attribs = {
             "NAME": cue.name,
@@ -362,7 +403,7 @@ class NMLGenerator(BaseGenerator):
         if cue.color:
             cue_attribs["COLOR"] = cue.color
 
-        ET.SubElement(cues, "CUE", **cue_attribs)
+        lines.append(_tag(4, "CUE", cue_attribs))
 
     def _format_traktor_path(self, path_str: str) -> str:
         """Format a path for Traktor's NML format."""
@@ -395,9 +436,7 @@ class NMLGenerator(BaseGenerator):
 
     def _generate_uuid(self) -> str:
         """Generate a simple UUID for playlists."""
-        import uuid
-
-        return str(uuid.uuid4()).replace("-", "").lower()
+        return uuid.uuid4().hex
 
     def _generate_track_key(self, track: Track, usb_path: Path = None) -> str:
         """Generate a track key for Traktor using proper NML path formatting."""
@@ -416,7 +455,7 @@ class NMLGenerator(BaseGenerator):
             path_parts = track_path.parts
             if len(path_parts) >= 1:
                 # Extract drive letter (e.g., 'C:')
-                backslash = '\\'
+                backslash = "\\"
                 drive_letter = path_parts[0].rstrip(backslash)  # e.g., 'D:'
                 # Get remaining path parts
                 remaining_parts = path_parts[1:]  # Skip the drive letter
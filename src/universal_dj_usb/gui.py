@@ -6,6 +6,7 @@ import sys
 import logging
 import threading
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -45,9 +46,9 @@ import psutil
 from typing import Optional
 
 from . import __version__
-from .parser import RekordboxParser
+from .parser import PDB_RELATIVE_PATHS, RekordboxParser, get_parser
 from .models import ConversionConfig, Playlist, ConversionResult, PlaylistTree
-from .generators import NMLGenerator, M3UGenerator, M3U8Generator
+from .generators import create_generators, sanitize_filename
 
 
 @dataclass
@@ -104,50 +105,45 @@ class ConversionWorker(QThread):
         config: ConversionConfig,
         output_dir: Path,
         usb_path: Path,
-        parser: RekordboxParser = None,
+        pdb_path: Path,
     ):
         super().__init__()
         self.playlists = playlists
         self.config = config
         self.output_dir = output_dir
         self.usb_path = usb_path
-        self.parser = parser
+        self.pdb_path = pdb_path
 
     def run(self):
         """Convert the selected playlists."""
         results = []
         total_playlists = len(self.playlists)
 
-        # Enhance playlists with file metadata if parser is available
-        enhanced_playlists = []
-        if self.parser:
-            self.conversion_progress.emit("Enhancing track metadata...", 5)
-            for playlist in self.playlists:
-                enhanced_playlist = self.parser.enhance_playlist_tracks(
-                    playlist, self.usb_path
-                )
-                enhanced_playlists.append(enhanced_playlist)
-        else:
-            enhanced_playlists = self.playlists
+        # Enhance playlists with file metadata. The worker uses its own parser:
+        # a Kaitai stream must not be shared between threads, and the window
+        # may re-parse or close its parser meanwhile.
+        self.conversion_progress.emit("Enhancing track metadata...", 5)
+        parser = RekordboxParser(self.pdb_path)
+        try:
+            enhanced_playlists = parser.enhance_playlists_tracks(
+                self.playlists, self.usb_path
+            )
+        finally:
+            parser.close()
 
         # Create generators based on format
-        generators = []
-        if self.config.output_format in ["nml", "all"]:
-            generators.append(NMLGenerator(self.config))
-        if self.config.output_format in ["m3u", "all"]:
-            generators.append(M3UGenerator(self.config))
-        if self.config.output_format in ["m3u8", "all"]:
-            generators.append(M3U8Generator(self.config))
+        generators = create_generators(self.config)
 
         for i, playlist in enumerate(enhanced_playlists):
             self.conversion_progress.emit(
                 f"Converting '{playlist.name}'...", int((i / total_playlists) * 100)
             )
 
+            safe_name = sanitize_filename(playlist.name)
             for generator in generators:
                 try:
                     # Generate output filename
-                    filename = generator._sanitize_filename(playlist.name)
+                    filename = safe_name
 
                     # Add format suffix if requested (before the extension)
                     if self.config.use_format_suffix:
@@ -601,41 +597,61 @@ class MainWindow(QMainWindow):
             f"[USB Detection] Scanning {len(partitions)} partitions directly..."
         )
 
-        for partition in partitions:
-            # Only check drives that look like USB drives
-            if "removable" in partition.opts or self._is_usb_drive_simple(
+        # Only check drives that look like USB drives
+        candidates = [
+            partition
+            for partition in partitions
+            if "removable" in partition.opts
+            or self._is_usb_drive_simple(
                 partition.device, partition.mountpoint, partition.fstype
-            ):
+            )
+        ]
+        if not candidates:
+            return drives
+
+        # Probe the mounts concurrently so one slow drive doesn't serialize the
+        # rest. Workers only touch the filesystem; logging stays on this thread.
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            futures = [
+                executor.submit(self._probe_usb_drive, partition.mountpoint)
+                for partition in candidates
+            ]
+
+            for partition, future in zip(candidates, futures):
                 try:
-                    path = Path(partition.mountpoint)
-                    usage = psutil.disk_usage(partition.mountpoint)
-
-                    # Check if it has Rekordbox database
-                    rekordbox_path = path / "PIONEER" / "rekordbox" / "export.pdb"
-                    has_rekordbox = rekordbox_path.exists()
-
-                    drives.append(
-                        USBDriveInfo(
-                            path=path,
-                            label=partition.mountpoint,
-                            size=usage.total,
-                            free_space=usage.free,
-                            has_rekordbox=has_rekordbox,
-                        )
-                    )
-
-                    self._log_message(
-                        f"[USB Detection] Found USB drive: {partition.device} -> {partition.mountpoint} (Rekordbox: {has_rekordbox})"
-                    )
-
+                    drive = future.result()
                 except (PermissionError, OSError) as e:
                     self._log_message(
                         f"[USB Detection] Error accessing {partition.device}: {e}"
                     )
                     continue
 
+                drives.append(drive)
+                self._log_message(
+                    f"[USB Detection] Found USB drive: {partition.device} -> {partition.mountpoint} (Rekordbox: {drive.has_rekordbox})"
+                )
+
         return drives
 
+    @staticmethod
+    def _probe_usb_drive(mountpoint: str) -> USBDriveInfo:
+        """Read a mounted drive's usage and check it for a Rekordbox database."""
+        path = Path(mountpoint)
+        usage = psutil.disk_usage(mountpoint)
+
+        # Check if it has Rekordbox database, canonical location first
+        has_rekordbox = any(
+            (path / relative_path).is_file() for relative_path in PDB_RELATIVE_PATHS
+        )
+
+        return USBDriveInfo(
+            path=path,
+            label=mountpoint,
+            size=usage.total,
+            free_space=usage.free,
+            has_rekordbox=has_rekordbox,
+        )
+
     def _is_usb_drive_simple(
         self, device: str, mountpoint: str = None, filesystem: str = None
     ) -> bool:
@@ -747,21 +763,25 @@ class MainWindow(QMainWindow):
             # Parse synchronously without threading
             self._log_message("Initializing parser...")
 
-            # Build the path to the Rekordbox database
-            rekordbox_pdb_path = (
-                self.current_usb_path / "PIONEER" / "rekordbox" / "export.pdb"
+            # Same lookup as the CLI, so drives with a lower-case "pioneer"
+            # folder (e.g. formatted on Linux) are found too
+            self._log_message(
+                f"Looking for Rekordbox database on: {self.current_usb_path}"
             )
-            self._log_message(f"Looking for database at: {rekordbox_pdb_path}")
+            rekordbox_pdb_path = RekordboxParser.find_pdb_file(self.current_usb_path)
 
-            if not rekordbox_pdb_path.exists():
+            if rekordbox_pdb_path is None:
                 raise FileNotFoundError(
-                    f"Rekordbox database not found at {rekordbox_pdb_path}"
+                    f"Rekordbox database not found on {self.current_usb_path}"
                 )
 
-            parser = RekordboxParser(rekordbox_pdb_path)
+            parser = get_parser(rekordbox_pdb_path)
+            # Keep the PDB mapped when the same (cached) parser comes back
+            if self.current_parser is not parser:
+                self._close_parser()
 
             self._log_message("Loading Rekordbox database...")
-            if not parser.parse():
+            if not parser.pdb_data and not parser.parse():
                 raise RuntimeError("Failed to parse the Rekordbox database")
 
             # Store parser for later use in enhancement
@@ -777,6 +797,13 @@ class MainWindow(QMainWindow):
             error_message = f"Failed to parse playlists: {str(e)}"
             self._on_parsing_error(error_message)
 
+    def _close_parser(self):
+        """Release the current parser's PDB file so the drive can be ejected."""
+        if self.current_parser is None:
+            return
+        self.current_parser.close()
+        self.current_parser = None
+
     def _on_playlists_parsed(self, playlist_tree: PlaylistTree):
         """Handle successful playlist parsing."""
         self.playlist_tree = playlist_tree
@@ -917,19 +944,33 @@ class MainWindow(QMainWindow):
         ):
             return
 
+        if self.current_parser is None or self.current_usb_path is None:
+            QMessageBox.warning(
+                self,
+                "No Database Loaded",
+                "Select a USB drive with a Rekordbox database before converting.",
+            )
+            return
+
         # Create conversion config
         config = self._create_conversion_config()
         output_dir = Path(self.output_dir_label.text())
         playlists = list(self.selected_playlists.values())
 
-        # Disable UI during conversion
+        # Disable UI during conversion, including switching drives
         self.convert_button.setEnabled(False)
+        self.usb_drive_combo.setEnabled(False)
+        self.refresh_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
         # Start conversion worker
         self.conversion_worker = ConversionWorker(
-            playlists, config, output_dir, self.current_usb_path, self.current_parser
+            playlists,
+            config,
+            output_dir,
+            self.current_usb_path,
+            self.current_parser.pdb_path,
         )
         self.conversion_worker.conversion_progress.connect(self._on_conversion_progress)
         self.conversion_worker.conversion_complete.connect(self._on_conversion_complete)
@@ -964,6 +1005,8 @@ class MainWindow(QMainWindow):
         """Handle conversion completion."""
         # Re-enable UI
         self.convert_button.setEnabled(True)
+        self.usb_drive_combo.setEnabled(bool(self.available_drives))
+        self.refresh_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self._update_conversion_button_state()
 
@@ -1025,6 +1068,8 @@ class MainWindow(QMainWindow):
             self.conversion_worker.wait(3000)
             self.conversion_worker = None
 
+        self._close_parser()
+
         print("All workers stopped, accepting close event")
         event.accept()
 
@@ -37,13 +37,13 @@ class AudioMetadataExtractor:
             return metadata
 
         if not file_path.exists():
-            logger.debug(f"File does not exist: {file_path}")
+            logger.debug("File does not exist: %s", file_path)
             return metadata
 
         try:
             audio_file = File(file_path)
             if audio_file is None:
-                logger.debug(f"Could not read audio file: {file_path}")
+                logger.debug("Could not read audio file: %s", file_path)
                 return metadata
 
             # Extract basic metadata
@@ -144,11 +144,11 @@ class AudioMetadataExtractor:
                     metadata["comment"] = str(tags["COMMENT"][0])
 
             if metadata:  # Only log if we extracted meaningful metadata
-                logger.debug(f"Extracted metadata from {file_path}: {metadata}")
+                logger.debug("Extracted metadata from %s: %s", file_path, metadata)
 
         except Exception as e:
             logger.debug(
-                f"Could not extract metadata from {file_path}: {e}"
+                "Could not extract metadata from %s: %s", file_path, e
             )  # Reduced to debug level
 
         return metadata
@@ -305,11 +305,11 @@ class AudioMetadataExtractor:
 
             if metadata:
                 logger.debug(
-                    f"Final extracted metadata from path {file_path}: {metadata}"
+                    "Final extracted metadata from path %s: %s", file_path, metadata
                 )
 
         except Exception as e:
-            logger.debug(f"Error extracting metadata from path {file_path}: {e}")
+            logger.debug("Error extracting metadata from path %s: %s", file_path, e)
 
         return metadata
 
@@ -446,7 +446,7 @@ class AudioMetadataExtractor:
             )
             if artist_from_title and is_valid_value(artist_from_title):
                 merged["artist"] = artist_from_title
-                logger.debug(f"Extracted artist from title: {artist_from_title}")
+                logger.debug("Extracted artist from title: %s", artist_from_title)
 
         return merged
 
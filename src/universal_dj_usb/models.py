@@ -1,6 +1,7 @@
 """Data models for playlist and track information."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from enum import Enum
@@ -35,7 +36,7 @@ class KeySignature(Enum):
     G_SHARP_MINOR = "G#m"
 
 
-@dataclass
+@dataclass(slots=True)
 class CuePoint:
     """Represents a cue point in a track."""
 
@@ -46,7 +47,7 @@ class CuePoint:
     loop_length: Optional[float] = None  # For loop type cues
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """Represents a music track with metadata."""
 
@@ -78,7 +79,7 @@ class Track:
         return self.file_path.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     """Represents a playlist with tracks."""
 
@@ -119,12 +120,26 @@ class PlaylistTree:
         """Get a playlist by its ID."""
         return self.all_playlists.get(playlist_id)
 
+    @cached_property
+    def by_name(self) -> Dict[str, Playlist]:
+        """Playlists keyed by name; the first one wins if names repeat."""
+        by_name: Dict[str, Playlist] = {}
+        for playlist in self.all_playlists.values():
+            by_name.setdefault(playlist.name, playlist)
+        return by_name
+
+    @cached_property
+    def convertible(self) -> List[Playlist]:
+        """Playlists that can be converted: not folders and not empty."""
+        return [
+            playlist
+            for playlist in self.all_playlists.values()
+            if not playlist.is_folder and playlist.track_count > 0
+        ]
+
     def get_playlist_by_name(self, name: str) -> Optional[Playlist]:
         """Get a playlist by its name."""
-        for playlist in self.all_playlists.values():
-            if playlist.name == name:
-                return playlist
-        return None
+        return self.by_name.get(name)
 
     def get_child_playlists(self, parent_id: int) -> List[Playlist]:
         """Get all child playlists of a given parent."""
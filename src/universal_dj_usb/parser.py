@@ -1,16 +1,41 @@
 """Rekordbox PDB parser using Kaitai Struct."""
 
 import logging
+import mmap
+import os
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from kaitaistruct import KaitaiStruct, KaitaiStream, BytesIO
+from kaitaistruct import KaitaiStruct, KaitaiStream
 
-from .models import Track, Playlist, PlaylistTree
+from .models import KeySignature, Track, Playlist, PlaylistTree
 from .kaitai.rekordbox_pdb import RekordboxPdb
 from .metadata_extractor import AudioMetadataExtractor
 
 logger = logging.getLogger(__name__)
 
+_ENTRY_ORDER = itemgetter("playlist_id", "entry_index")
+
+# Where Rekordbox exports its database, relative to the USB drive root
+PDB_RELATIVE_PATHS = (
+    Path("PIONEER") / "rekordbox" / "export.pdb",
+    Path("Pioneer") / "rekordbox" / "export.pdb",
+    Path("pioneer") / "rekordbox" / "export.pdb",
+)
+
+
+def _string_text(
+    string_ref: Optional[RekordboxPdb.DeviceSqlString], default: str = ""
+) -> str:
+    """Return the text of a DeviceSQL string field, or default if it is empty.
+
+    The field and its body are each read once; the chained
+    ``ref.body.text if ref and ref.body`` form resolved them twice per row.
+    """
+    body = string_ref.body if string_ref else None
+    return body.text if body else default
+
 
 class RekordboxParser:
     """Parser for Rekordbox PDB files using Kaitai Struct."""
@@ -19,19 +44,34 @@ class RekordboxParser:
         """Initialize the parser with a PDB file path."""
         self.pdb_path = pdb_path
         self.pdb_data: Optional[RekordboxPdb] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._tables_by_type: Dict[RekordboxPdb.PageType, RekordboxPdb.Table] = {}
         self._tracks_cache: Dict[int, Track] = {}
+        self._minimal_tracks_cache: Dict[int, Track] = {}
+        self._full_tracks_by_path: Optional[Dict[str, Track]] = None
+        self._lookup_tables_cache: Dict[str, Dict[int, str]] = {}
         self._playlists_cache: List[Playlist] = []
 
     def parse(self) -> bool:
-        """Parse the PDB file."""
+        """Parse the PDB file, dropping anything extracted from an earlier parse."""
+        self.close()
+        self._tracks_cache = {}
+        self._minimal_tracks_cache = {}
+        self._full_tracks_by_path = None
+        self._lookup_tables_cache = {}
         try:
             with open(self.pdb_path, "rb") as f:
-                # Read the entire file into memory
-                data = f.read()
-                # Create KaitaiStream from the data
-                stream = KaitaiStream(BytesIO(data))
-                # Parse with Kaitai Struct
-                self.pdb_data = RekordboxPdb(False, stream)
+                # Map the file instead of reading it into a bytes copy; Kaitai
+                # only needs read/seek/tell, and pages are loaded lazily from it.
+                # The mapping stays valid after the file object is closed.
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            stream = KaitaiStream(self._mmap)
+            # Parse with Kaitai Struct
+            self.pdb_data = RekordboxPdb(False, stream)
+            # Index tables by type once; keep the first table of each type
+            self._tables_by_type = {}
+            for table in self.pdb_data.tables:
+                self._tables_by_type.setdefault(table.type, table)
             logger.info(f"Successfully parsed PDB file: {self.pdb_path}")
 
             # Debug: log available tables
@@ -43,6 +83,18 @@ class RekordboxParser:
             logger.error(f"Failed to parse PDB file {self.pdb_path}: {e}")
             return False
 
+    def close(self) -> None:
+        """Release the memory-mapped PDB file.
+
+        Already extracted tracks and playlists stay usable; anything that needs
+        the PDB again parses it first.
+        """
+        self.pdb_data = None
+        self._tables_by_type = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
     def get_playlists(self, usb_path: Optional[Path] = None) -> PlaylistTree:
         """Extract all playlists from the PDB with minimal track info for performance."""
         if not self.pdb_data and not self.parse():
@@ -56,17 +108,19 @@ class RekordboxParser:
             # Get minimal track info only (just IDs and names for listing)
             minimal_tracks = self._extract_minimal_tracks()
 
+            # Entry rows are not stored in playlist order. Sorting them once by
+            # (playlist, index) means every group below is built already in order.
+            playlist_entries.sort(key=_ENTRY_ORDER)
+            track_ids_by_playlist = defaultdict(list)
+            for entry in playlist_entries:
+                track_ids_by_playlist[entry["playlist_id"]].append(entry["track_id"])
+
             # Build playlist objects
             playlists_dict = {}
-            root_playlists = []
 
             for meta in playlist_metadata:
                 # Get tracks for this playlist
-                track_ids = [
-                    entry["track_id"]
-                    for entry in playlist_entries
-                    if entry["playlist_id"] == meta["id"]
-                ]
+                track_ids = track_ids_by_playlist.get(meta["id"], [])
                 tracks = [minimal_tracks.get(track_id) for track_id in track_ids]
                 tracks = [track for track in tracks if track is not None]
 
@@ -80,9 +134,11 @@ class RekordboxParser:
 
                 playlists_dict[meta["id"]] = playlist
 
-                # Add to root if no parent
-                if playlist.parent_id is None:
-                    root_playlists.append(playlist)
+            root_playlists = [
+                playlist
+                for playlist in playlists_dict.values()
+                if playlist.parent_id is None
+            ]
 
             return PlaylistTree(
                 root_playlists=root_playlists, all_playlists=playlists_dict
@@ -95,13 +151,9 @@ class RekordboxParser:
     def _extract_playlist_metadata(self) -> List[Dict]:
         """Extract playlist metadata from the playlist tree table."""
         playlists = []
+        add_playlist = playlists.append
 
-        # Find the playlist tree table (type 7)
-        playlist_tree_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.playlist_tree:
-                playlist_tree_table = table
-                break
+        playlist_tree_table = self._get_table(RekordboxPdb.PageType.playlist_tree)
 
         if not playlist_tree_table:
             logger.warning("No playlist tree table found")
@@ -128,17 +180,13 @@ class RekordboxParser:
 
                             playlist_meta = {
                                 "id": playlist_row.id,
-                                "name": (
-                                    playlist_row.name.body.text
-                                    if playlist_row.name and playlist_row.name.body
-                                    else ""
-                                ),
+                                "name": _string_text(playlist_row.name),
                                 "parent_id": playlist_row.parent_id,
                                 "is_folder": playlist_row.is_folder,
                                 "sort_order": playlist_row.sort_order,
                             }
 
-                            playlists.append(playlist_meta)
+                            add_playlist(playlist_meta)
 
                 # Move to next page
                 current_page = (
@@ -155,13 +203,9 @@ class RekordboxParser:
     def _extract_playlist_entries(self) -> List[Dict]:
         """Extract playlist entries (track associations) from the PDB."""
         entries = []
+        add_entry = entries.append
 
-        # Find the playlist entries table (type 8)
-        playlist_entries_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.playlist_entries:
-                playlist_entries_table = table
-                break
+        playlist_entries_table = self._get_table(RekordboxPdb.PageType.playlist_entries)
 
         if not playlist_entries_table:
             logger.warning("No playlist entries table found")
@@ -192,7 +236,7 @@ class RekordboxParser:
                                 "entry_index": entry_row.entry_index,
                             }
 
-                            entries.append(entry)
+                            add_entry(entry)
 
                 # Move to next page
                 current_page = (
@@ -208,14 +252,12 @@ class RekordboxParser:
 
     def _extract_minimal_tracks(self) -> Dict[int, Track]:
         """Extract minimal track info for playlist listing (IDs, names, paths only)."""
+        if self._minimal_tracks_cache:
+            return self._minimal_tracks_cache
+
         tracks = {}
 
-        # Find the tracks table (type 0)
-        tracks_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.tracks:
-                tracks_table = table
-                break
+        tracks_table = self._get_table(RekordboxPdb.PageType.tracks)
 
         if not tracks_table:
             logger.warning("No tracks table found")
@@ -241,9 +283,7 @@ class RekordboxParser:
                             track_row = row_ref.body
 
                             # Extract only minimal info - no metadata lookups
-                            file_path_str = ""
-                            if track_row.file_path and track_row.file_path.body:
-                                file_path_str = track_row.file_path.body.text
+                            file_path_str = _string_text(track_row.file_path)
 
                             # Create minimal Track object
                             file_path = (
@@ -253,11 +293,7 @@ class RekordboxParser:
                             )
 
                             track = Track(
-                                title=(
-                                    track_row.title.body.text
-                                    if track_row.title and track_row.title.body
-                                    else "Unknown"
-                                ),
+                                title=_string_text(track_row.title, "Unknown"),
                                 artist="Unknown",  # Will be resolved during enhancement if needed
                                 file_path=file_path,
                                 # Leave other fields as defaults - they'll be filled during enhancement
@@ -266,13 +302,9 @@ class RekordboxParser:
                             tracks[track_row.id] = track
 
                 # Move to next page
-                try:
-                    current_page = (
-                        page_data.next_page if page_data.next_page.index > 0 else None
-                    )
-                except Exception as page_error:
-                    logger.debug(f"Reached end of minimal tracks table: {page_error}")
-                    break
+                current_page = (
+                    page_data.next_page if page_data.next_page.index > 0 else None
+                )
 
             except Exception as e:
                 # Check if this is a common end-of-data condition
@@ -288,6 +320,7 @@ class RekordboxParser:
                 break
 
         logger.info(f"Found {len(tracks)} tracks (minimal info)")
+        self._minimal_tracks_cache = tracks
         return tracks
 
     def _extract_tracks(self) -> Dict[int, Track]:
@@ -300,12 +333,7 @@ class RekordboxParser:
         # Extract lookup tables first
         lookup_tables = self._extract_lookup_tables()
 
-        # Find the tracks table (type 0)
-        tracks_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.tracks:
-                tracks_table = table
-                break
+        tracks_table = self._get_table(RekordboxPdb.PageType.tracks)
 
         if not tracks_table:
             logger.warning("No tracks table found")
@@ -331,9 +359,7 @@ class RekordboxParser:
                             track_row = row_ref.body
 
                             # Extract file path
-                            file_path_str = ""
-                            if track_row.file_path and track_row.file_path.body:
-                                file_path_str = track_row.file_path.body.text
+                            file_path_str = _string_text(track_row.file_path)
 
                             # Create Track object with resolved metadata
                             artist_name = "Unknown"
@@ -348,7 +374,10 @@ class RekordboxParser:
                                 # Only log debug for first 5 tracks to avoid spam
                                 if len(tracks) < 5:
                                     logger.debug(
-                                        f"Track {track_row.id}: artist_id={track_row.artist_id} -> '{artist_name}'"
+                                        "Track %s: artist_id=%s -> '%s'",
+                                        track_row.id,
+                                        track_row.artist_id,
+                                        artist_name,
                                     )
 
                             album_name = None
@@ -363,7 +392,10 @@ class RekordboxParser:
                                 # Only log debug for first 5 tracks to avoid spam
                                 if len(tracks) < 5:
                                     logger.debug(
-                                        f"Track {track_row.id}: album_id={track_row.album_id} -> '{album_name}'"
+                                        "Track %s: album_id=%s -> '%s'",
+                                        track_row.id,
+                                        track_row.album_id,
+                                        album_name,
                                     )
 
                             genre_name = None
@@ -378,7 +410,10 @@ class RekordboxParser:
                                 # Only log debug for first 5 tracks to avoid spam
                                 if len(tracks) < 5:
                                     logger.debug(
-                                        f"Track {track_row.id}: genre_id={track_row.genre_id} -> '{genre_name}'"
+                                        "Track %s: genre_id=%s -> '%s'",
+                                        track_row.id,
+                                        track_row.genre_id,
+                                        genre_name,
                                     )
 
                             # Create Track object with PDB metadata only (fast)
@@ -389,11 +424,7 @@ class RekordboxParser:
                             )
 
                             track = Track(
-                                title=(
-                                    track_row.title.body.text
-                                    if track_row.title and track_row.title.body
-                                    else "Unknown"
-                                ),
+                                title=_string_text(track_row.title, "Unknown"),
                                 artist=artist_name,
                                 file_path=file_path,
                                 album=album_name,
@@ -445,14 +476,9 @@ class RekordboxParser:
                             tracks[track_row.id] = track
 
                 # Move to next page
-                try:
-                    current_page = (
-                        page_data.next_page if page_data.next_page.index > 0 else None
-                    )
-                except Exception as page_error:
-                    # This often happens at the end of the table - not necessarily an error
-                    logger.debug(f"Reached end of tracks table: {page_error}")
-                    break
+                current_page = (
+                    page_data.next_page if page_data.next_page.index > 0 else None
+                )
 
             except Exception as e:
                 # Check if this is a common end-of-data condition
@@ -476,13 +502,8 @@ class RekordboxParser:
     @staticmethod
     def find_pdb_file(usb_path: Path) -> Optional[Path]:
         """Find the Rekordbox PDB file on a USB drive."""
-        potential_paths = [
-            usb_path / "PIONEER" / "rekordbox" / "export.pdb",
-            usb_path / "Pioneer" / "rekordbox" / "export.pdb",
-            usb_path / "pioneer" / "rekordbox" / "export.pdb",
-        ]
-
-        for pdb_path in potential_paths:
+        for relative_path in PDB_RELATIVE_PATHS:
+            pdb_path = usb_path / relative_path
             if pdb_path.exists():
                 logger.info(f"Found PDB file at: {pdb_path}")
                 return pdb_path
@@ -490,6 +511,12 @@ class RekordboxParser:
         logger.error(f"No PDB file found in {usb_path}")
         return None
 
+    def _get_table(
+        self, page_type: RekordboxPdb.PageType
+    ) -> Optional[RekordboxPdb.Table]:
+        """Return the table of the given page type, if present in the PDB."""
+        return self._tables_by_type.get(page_type)
+
     def _log_available_tables(self) -> None:
         """Log all available tables in the PDB for debugging."""
         logger.debug("Available PDB tables:")
@@ -500,6 +527,9 @@ class RekordboxParser:
 
     def _extract_lookup_tables(self) -> Dict[str, Dict[int, str]]:
         """Extract lookup tables (artists, albums, genres, etc.) for metadata resolution."""
+        if self._lookup_tables_cache:
+            return self._lookup_tables_cache
+
         lookup_tables = {
             "artists": {},
             "albums": {},
@@ -509,11 +539,7 @@ class RekordboxParser:
         }
 
         # Extract artists
-        artists_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.artists:
-                artists_table = table
-                break
+        artists_table = self._get_table(RekordboxPdb.PageType.artists)
 
         if artists_table:
             lookup_tables["artists"] = self._extract_string_lookup_table(
@@ -521,11 +547,7 @@ class RekordboxParser:
             )
 
         # Extract albums
-        albums_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.albums:
-                albums_table = table
-                break
+        albums_table = self._get_table(RekordboxPdb.PageType.albums)
 
         if albums_table:
             lookup_tables["albums"] = self._extract_string_lookup_table(
@@ -533,11 +555,7 @@ class RekordboxParser:
             )
 
         # Extract genres
-        genres_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.genres:
-                genres_table = table
-                break
+        genres_table = self._get_table(RekordboxPdb.PageType.genres)
 
         if genres_table:
             lookup_tables["genres"] = self._extract_string_lookup_table(
@@ -545,11 +563,7 @@ class RekordboxParser:
             )
 
         # Extract labels
-        labels_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.labels:
-                labels_table = table
-                break
+        labels_table = self._get_table(RekordboxPdb.PageType.labels)
 
         if labels_table:
             lookup_tables["labels"] = self._extract_string_lookup_table(
@@ -557,17 +571,14 @@ class RekordboxParser:
             )
 
         # Extract keys
-        keys_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.keys:
-                keys_table = table
-                break
+        keys_table = self._get_table(RekordboxPdb.PageType.keys)
 
         if keys_table:
             lookup_tables["keys"] = self._extract_string_lookup_table(
                 keys_table, "keys"
             )
 
+        self._lookup_tables_cache = lookup_tables
         return lookup_tables
 
     def _extract_string_lookup_table(self, table, table_name: str) -> Dict[int, str]:
@@ -593,15 +604,7 @@ class RekordboxParser:
 
                             # All these tables have id and name properties
                             if hasattr(row, "id") and hasattr(row, "name"):
-                                name_text = ""
-                                if (
-                                    row.name
-                                    and hasattr(row.name, "body")
-                                    and row.name.body
-                                ):
-                                    name_text = row.name.body.text
-
-                                lookup_dict[row.id] = name_text
+                                lookup_dict[row.id] = _string_text(row.name)
 
                 # Move to next page
                 current_page = (
@@ -697,7 +700,9 @@ class RekordboxParser:
                         )
                     except Exception as e:
                         logger.debug(
-                            f"Could not extract file metadata for {track.file_path}: {e}"
+                            "Could not extract file metadata for %s: %s",
+                            track.file_path,
+                            e,
                         )
 
                 # Merge all metadata sources
@@ -709,19 +714,20 @@ class RekordboxParser:
                 final_artist = merged_metadata.get("artist", "Unknown")
                 if final_artist == "Unknown":
                     logger.debug(
-                        f"Artist extraction failed for {track.file_path}. "
-                        f"PDB: {pdb_metadata.get('artist')}, "
-                        f"Path: {path_metadata.get('artist')}, "
-                        f"File: {file_metadata.get('artist')}"
+                        "Artist extraction failed for %s. PDB: %s, Path: %s, File: %s",
+                        track.file_path,
+                        pdb_metadata.get("artist"),
+                        path_metadata.get("artist"),
+                        file_metadata.get("artist"),
                     )
                 elif track.artist == "Unknown" and final_artist != "Unknown":
                     logger.debug(
-                        f"Artist enhanced from {track.artist} to {final_artist} for {track.file_path}"
+                        "Artist enhanced from %s to %s for %s",
+                        track.artist,
+                        final_artist,
+                        track.file_path,
                     )
 
-                # Create enhanced track
-                from .models import KeySignature
-
                 # Handle key conversion - if it's a string, try to match to enum
                 key_value = merged_metadata.get("key")
                 track_key = None
@@ -729,12 +735,13 @@ class RekordboxParser:
                     if isinstance(key_value, KeySignature):
                         track_key = key_value
                     elif isinstance(key_value, str):
-                        # Try to find matching enum value
-                        for key_enum in KeySignature:
-                            if key_enum.value == key_value:
-                                track_key = key_enum
-                                break
+                        # Enum lookup by value is a dict hit, not a scan
+                        try:
+                            track_key = KeySignature(key_value)
+                        except ValueError:
+                            pass
 
+                # Create enhanced track
                 enhanced_track = Track(
                     title=merged_metadata.get("title", "Unknown"),
                     artist=merged_metadata.get("artist", "Unknown"),
@@ -776,34 +783,67 @@ class RekordboxParser:
         Returns:
             Playlist with enhanced tracks
         """
-        if not usb_path:
-            return playlist
+        return self.enhance_playlists_tracks([playlist], usb_path)[0]
+
+    def enhance_playlists_tracks(
+        self, playlists: List[Playlist], usb_path: Path
+    ) -> List[Playlist]:
+        """
+        Enhance the tracks of several playlists, reading each track only once.
+
+        Tracks shared between playlists are the same Track object, so they are
+        enhanced once and every playlist gets the same enhanced Track back.
+
+        Args:
+            playlists: Playlist objects to enhance
+            usb_path: Path to the USB drive
+
+        Returns:
+            Playlists with enhanced tracks, in the same order
+        """
+        if not usb_path or not playlists:
+            return list(playlists)
+
+        # The playlists may come from a cached tree, before this parser has
+        # read the PDB.
+        if not self.pdb_data and not self.parse():
+            return list(playlists)
+
+        unique_tracks: Dict[int, Track] = {}
+        for playlist in playlists:
+            for track in playlist.tracks:
+                unique_tracks.setdefault(id(track), track)
 
         logger.info(
-            f"Enhancing {len(playlist.tracks)} tracks for playlist '{playlist.name}'"
+            f"Enhancing {len(unique_tracks)} tracks for {len(playlists)} playlists"
         )
 
-        # Extract full metadata only for tracks in this playlist
+        # Extract full metadata only for tracks in these playlists
+        minimal_tracks = list(unique_tracks.values())
         track_ids = [
-            track.file_path.stem for track in playlist.tracks if track.file_path
+            track.file_path.stem for track in minimal_tracks if track.file_path
         ]
         enhanced_tracks = self._extract_specific_tracks_full_metadata(
-            track_ids, playlist.tracks
+            track_ids, minimal_tracks
         )
 
         # Further enhance with file system metadata
         final_tracks = self._enhance_tracks_with_file_metadata(
             enhanced_tracks, usb_path
         )
-
-        # Create new playlist with enhanced tracks
-        return Playlist(
-            id=playlist.id,
-            name=playlist.name,
-            tracks=final_tracks,
-            is_folder=playlist.is_folder,
-            parent_id=playlist.parent_id,
-        )
+        final_by_track = dict(zip(unique_tracks, final_tracks))
+
+        # Create new playlists with enhanced tracks
+        return [
+            Playlist(
+                id=playlist.id,
+                name=playlist.name,
+                tracks=[final_by_track[id(track)] for track in playlist.tracks],
+                is_folder=playlist.is_folder,
+                parent_id=playlist.parent_id,
+            )
+            for playlist in playlists
+        ]
 
     def _extract_specific_tracks_full_metadata(
         self, track_ids: List[str], minimal_tracks: List[Track]
@@ -821,184 +861,67 @@ class RekordboxParser:
         if not minimal_tracks:
             return []
 
-        # Create mapping from file paths to minimal tracks with original order
-        track_by_path = {}
-        track_order = {}  # Maps file path to original index
-        for i, track in enumerate(minimal_tracks):
-            if track.file_path:
-                path_str = str(track.file_path)
-                track_by_path[path_str] = track
-                track_order[path_str] = i
-
-        # Initialize enhanced tracks list with None placeholders to preserve order
-        enhanced_tracks = [None] * len(minimal_tracks)
-
-        # Extract lookup tables (only if we need to enhance tracks)
-        lookup_tables = self._extract_lookup_tables()
-
-        # Find the tracks table (type 0)
-        tracks_table = None
-        for table in self.pdb_data.tables:
-            if table.type == RekordboxPdb.PageType.tracks:
-                tracks_table = table
-                break
-
-        if not tracks_table:
-            logger.warning("No tracks table found for enhancement")
-            return minimal_tracks
+        # The tracks table is walked once per parser; each playlist after that
+        # is a dict lookup per track instead of another scan of every row.
+        full_tracks_by_path = self._get_full_tracks_by_path()
 
-        # Parse tracks table looking for our specific tracks
-        current_page = tracks_table.first_page
+        enhanced_tracks = []
         found_tracks = 0
-        target_count = len(minimal_tracks)
+        for track in minimal_tracks:
+            full_track = full_tracks_by_path.get(str(track.file_path))
+            if full_track is None:
+                enhanced_tracks.append(track)
+            else:
+                enhanced_tracks.append(full_track)
+                found_tracks += 1
 
-        while current_page and current_page.index > 0 and found_tracks < target_count:
-            try:
-                page_data = current_page.body
+        logger.debug(f"Enhanced {found_tracks} tracks with full PDB metadata")
 
-                if not page_data.is_data_page:
-                    current_page = (
-                        page_data.next_page if page_data.next_page.index > 0 else None
-                    )
-                    continue
+        return enhanced_tracks
 
-                # Process all row groups in this page
-                for row_group in page_data.row_groups:
-                    for row_ref in row_group.rows:
-                        if row_ref.present and row_ref.body:
-                            track_row = row_ref.body
+    def _get_full_tracks_by_path(self) -> Dict[str, Track]:
+        """Return full-metadata tracks keyed by their PDB file path."""
+        if self._full_tracks_by_path is None:
+            self._full_tracks_by_path = {
+                str(track.file_path): track
+                for track in self._extract_tracks().values()
+                if track.file_path != Path("Unknown")
+            }
+        return self._full_tracks_by_path
 
-                            # Extract file path
-                            file_path_str = ""
-                            if track_row.file_path and track_row.file_path.body:
-                                file_path_str = track_row.file_path.body.text
-
-                            # Check if this track is in our target list
-                            if file_path_str and file_path_str in track_by_path:
-                                # Create enhanced Track object with full metadata
-                                artist_name = "Unknown"
-                                if (
-                                    hasattr(track_row, "artist_id")
-                                    and track_row.artist_id > 0
-                                ):
-                                    artist_name = lookup_tables["artists"].get(
-                                        track_row.artist_id,
-                                        f"Unknown[ID:{track_row.artist_id}]",
-                                    )
 
-                                album_name = None
-                                if (
-                                    hasattr(track_row, "album_id")
-                                    and track_row.album_id > 0
-                                ):
-                                    album_name = lookup_tables["albums"].get(
-                                        track_row.album_id,
-                                        f"Unknown[ID:{track_row.album_id}]",
-                                    )
+# Parsers by PDB path, size and mtime; see get_parser()
+_PARSER_CACHE: Dict[Tuple[str, int, int], RekordboxParser] = {}
 
-                                genre_name = None
-                                if (
-                                    hasattr(track_row, "genre_id")
-                                    and track_row.genre_id > 0
-                                ):
-                                    genre_name = lookup_tables["genres"].get(
-                                        track_row.genre_id,
-                                        f"Unknown[ID:{track_row.genre_id}]",
-                                    )
 
-                                file_path = Path(file_path_str)
-
-                                enhanced_track = Track(
-                                    title=(
-                                        track_row.title.body.text
-                                        if track_row.title and track_row.title.body
-                                        else "Unknown"
-                                    ),
-                                    artist=artist_name,
-                                    file_path=file_path,
-                                    album=album_name,
-                                    genre=genre_name,
-                                    year=(
-                                        track_row.year
-                                        if hasattr(track_row, "year")
-                                        and track_row.year > 0
-                                        else None
-                                    ),
-                                    bpm=(
-                                        (track_row.tempo / 100.0)
-                                        if hasattr(track_row, "tempo")
-                                        and track_row.tempo > 0
-                                        else None
-                                    ),
-                                    duration=(
-                                        track_row.duration
-                                        if hasattr(track_row, "duration")
-                                        and track_row.duration > 0
-                                        else None
-                                    ),
-                                    bitrate=(
-                                        track_row.bitrate * 1000  # Convert kbps to bps
-                                        if hasattr(track_row, "bitrate")
-                                        and track_row.bitrate > 0
-                                        else None
-                                    ),
-                                    sample_rate=(
-                                        track_row.sample_rate
-                                        if hasattr(track_row, "sample_rate")
-                                        and track_row.sample_rate > 0
-                                        else None
-                                    ),
-                                    file_size=(
-                                        track_row.file_size
-                                        if hasattr(track_row, "file_size")
-                                        and track_row.file_size > 0
-                                        else None
-                                    ),
-                                    rating=(
-                                        track_row.rating
-                                        if hasattr(track_row, "rating")
-                                        and track_row.rating > 0
-                                        else None
-                                    ),
-                                )
+def get_parser(
+    pdb_path: Path, stat: Optional[os.stat_result] = None
+) -> RekordboxParser:
+    """Get the shared parser for a PDB file, creating it on first use.
 
-                                # Place track at correct index to preserve order
-                                original_index = track_order[file_path_str]
-                                enhanced_tracks[original_index] = enhanced_track
-                                found_tracks += 1
+    The same parser is returned while the file's size and mtime are unchanged,
+    so tracks and lookup tables it already extracted are reused. The parser is
+    not parsed here; call parse() if pdb_data is None. A parser for an older
+    version of the same file is closed and dropped.
 
-                # Move to next page
-                try:
-                    current_page = (
-                        page_data.next_page if page_data.next_page.index > 0 else None
-                    )
-                except Exception as page_error:
-                    logger.debug(
-                        f"Reached end of tracks table during enhancement: {page_error}"
-                    )
-                    break
+    Parsers are not thread-safe: worker threads should create their own
+    RekordboxParser instead of using a shared one.
 
-            except Exception as e:
-                error_msg = str(e).lower()
-                if (
-                    "requested" in error_msg
-                    and "bytes" in error_msg
-                    and "but only" in error_msg
-                ):
-                    logger.debug(f"Reached end of tracks data during enhancement: {e}")
-                else:
-                    logger.error(
-                        f"Error processing tracks page during enhancement: {e}"
-                    )
-                break
+    Args:
+        pdb_path: Path to the export.pdb file
+        stat: Result of pdb_path.stat(), if the caller already has it
 
-        logger.debug(
-            f"Enhanced {len([t for t in enhanced_tracks if t is not None])} tracks with full PDB metadata"
-        )
+    Returns:
+        RekordboxParser for the current version of the file
+    """
+    if stat is None:
+        stat = pdb_path.stat()
+    key = (str(pdb_path), stat.st_size, stat.st_mtime_ns)
 
-        # Fill any None slots with original minimal tracks
-        for i, enhanced_track in enumerate(enhanced_tracks):
-            if enhanced_track is None:
-                enhanced_tracks[i] = minimal_tracks[i]
+    parser = _PARSER_CACHE.get(key)
+    if parser is None:
+        for old_key in [k for k in _PARSER_CACHE if k[0] == key[0]]:
+            _PARSER_CACHE.pop(old_key).close()
+        parser = _PARSER_CACHE[key] = RekordboxParser(pdb_path)
 
-        return enhanced_tracks
+    return parser
@@ -0,0 +1,195 @@
+"""Test the command-line interface caching."""
+
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from universal_dj_usb import cli as cli_module
+from universal_dj_usb import parser as parser_module
+from universal_dj_usb.cli import cli
+from universal_dj_usb.models import Playlist, PlaylistTree, Track
+
+
+class FakeParser:
+    """Stand-in for RekordboxParser that counts parses."""
+
+    def __init__(self, pdb_path: Path):
+        self.pdb_path = pdb_path
+        self.pdb_data = None
+        self.parse_count = 0
+        self.enhanced = []
+
+    def parse(self) -> bool:
+        self.parse_count += 1
+        self.pdb_data = object()
+        return True
+
+    def close(self) -> None:
+        self.pdb_data = None
+
+    def get_playlists(self, usb_path: Path = None) -> PlaylistTree:
+        track = Track(
+            title="Song",
+            artist="Artist",
+            file_path=Path("/Contents/Artist/song.mp3"),
+        )
+        playlist = Playlist(name="Set", tracks=[track], id=1)
+        return PlaylistTree(root_playlists=[playlist], all_playlists={1: playlist})
+
+    def enhance_playlists_tracks(self, playlists, usb_path):
+        self.enhanced.extend(playlist.name for playlist in playlists)
+        return playlists
+
+
+@pytest.fixture
+def usb_drive(tmp_path):
+    """A USB drive with a (dummy) export.pdb and one audio file."""
+    usb_path = tmp_path / "usb"
+    pdb_path = usb_path / "PIONEER" / "rekordbox" / "export.pdb"
+    pdb_path.parent.mkdir(parents=True)
+    pdb_path.write_bytes(b"pdb")
+    song = usb_path / "Contents" / "Artist" / "song.mp3"
+    song.parent.mkdir(parents=True)
+    song.write_bytes(b"audio")
+    return usb_path
+
+
+@pytest.fixture
+def fake_parser(usb_drive, tmp_path, monkeypatch):
+    """Route the CLI to a FakeParser and a temporary cache directory."""
+    parsers = []
+
+    def get_parser(pdb_path, stat=None):
+        parser = FakeParser(pdb_path)
+        parsers.append(parser)
+        return parser
+
+    monkeypatch.setattr(parser_module, "get_parser", get_parser)
+    monkeypatch.setattr(cli_module, "CACHE_DIR", tmp_path / "cache")
+    return parsers
+
+
+def run_convert(usb_drive, output, *args, use_cache=True):
+    """Run the convert command to M3U with extra options and return its result."""
+    cache_args = [] if use_cache else ["--no-cache"]
+    result = CliRunner().invoke(
+        cli,
+        [*cache_args, "convert", str(usb_drive), "-o", str(output), "-f", "m3u", *args],
+    )
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def test_convert_skips_up_to_date_files(usb_drive, fake_parser, tmp_path):
+    """Test a second conversion skips unchanged outputs."""
+    output = tmp_path / "out"
+    run_convert(usb_drive, output)
+    result = run_convert(usb_drive, output)
+
+    assert "Skipped 1 up-to-date file" in result.output
+    assert fake_parser[-1].enhanced == []
+
+
+def test_convert_rewrites_after_track_file_changes(usb_drive, fake_parser, tmp_path):
+    """Test retagging an audio file makes its playlist stale."""
+    output = tmp_path / "out"
+    run_convert(usb_drive, output)
+
+    song = usb_drive / "Contents" / "Artist" / "song.mp3"
+    song.write_bytes(b"retagged audio")
+    os.utime(song, ns=(0, 0))
+    result = run_convert(usb_drive, output)
+
+    assert "Skipped" not in result.output
+    assert fake_parser[-1].enhanced == ["Set"]
+
+
+def test_convert_force_and_no_cache_rewrite(usb_drive, fake_parser, tmp_path):
+    """Test --force and --no-cache both regenerate unchanged outputs."""
+    output = tmp_path / "out"
+    run_convert(usb_drive, output)
+
+    result = run_convert(usb_drive, output, "--force")
+    assert "Skipped" not in result.output
+
+    result = run_convert(usb_drive, output)
+    assert "Skipped 1 up-to-date file" in result.output
+
+    result = run_convert(usb_drive, output, use_cache=False)
+    assert "Skipped" not in result.output
+
+
+def test_convert_relative_output_is_keyed_by_absolute_path(
+    usb_drive, fake_parser, tmp_path, monkeypatch
+):
+    """Test the same relative --output in two directories are tracked apart."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    run_convert(usb_drive, Path("out"))
+    monkeypatch.chdir(second)
+    result = run_convert(usb_drive, Path("out"))
+    assert "Skipped" not in result.output
+
+    monkeypatch.chdir(first)
+    result = run_convert(usb_drive, Path("out"))
+    assert "Skipped 1 up-to-date file" in result.output
+
+
+def run_detect(usb_drive, use_cache=True):
+    """Run the detect command and return its result."""
+    cache_args = [] if use_cache else ["--no-cache"]
+    result = CliRunner().invoke(cli, [*cache_args, "detect", str(usb_drive)])
+    assert result.exit_code == 0, result.output
+    assert "Found 1 playlists" in result.output
+    return result
+
+
+def test_playlist_tree_cache_hit(usb_drive, fake_parser):
+    """Test an unchanged PDB is not parsed again."""
+    result = run_detect(usb_drive)
+    assert "Successfully parsed database" in result.output
+    result = run_detect(usb_drive)
+    assert "Loaded playlists from cache" in result.output
+
+    assert [parser.parse_count for parser in fake_parser] == [1, 0]
+
+
+def test_playlist_tree_cache_miss_after_pdb_change(usb_drive, fake_parser):
+    """Test a PDB with a new size or mtime is parsed again."""
+    pdb_path = usb_drive / "PIONEER" / "rekordbox" / "export.pdb"
+    run_detect(usb_drive)
+
+    pdb_path.write_bytes(b"new pdb")
+    run_detect(usb_drive)
+    os.utime(pdb_path, ns=(0, 0))
+    run_detect(usb_drive)
+
+    assert [parser.parse_count for parser in fake_parser] == [1, 1, 1]
+
+
+def test_playlist_tree_cache_corrupt_file(usb_drive, fake_parser, tmp_path):
+    """Test a corrupt cache file falls back to parsing the PDB."""
+    run_detect(usb_drive)
+    (cache_file,) = (tmp_path / "cache").glob("*.pickle")
+    cache_file.write_bytes(cache_file.read_bytes()[:-10])
+
+    run_detect(usb_drive)
+
+    assert [parser.parse_count for parser in fake_parser] == [1, 1]
+
+
+def test_playlist_tree_cache_disabled(usb_drive, fake_parser, tmp_path):
+    """Test --no-cache neither reads nor writes the playlist cache."""
+    run_detect(usb_drive, use_cache=False)
+    assert not (tmp_path / "cache").exists()
+
+    run_detect(usb_drive)
+    run_detect(usb_drive, use_cache=False)
+
+    assert [parser.parse_count for parser in fake_parser] == [1, 1, 1]
@@ -5,7 +5,13 @@ from pathlib import Path
 from unittest.mock import Mock
 
 from universal_dj_usb.models import Track, Playlist, ConversionConfig
-from universal_dj_usb.generators import M3UGenerator, M3U8Generator, NMLGenerator
+from universal_dj_usb.generators import (
+    M3UGenerator,
+    M3U8Generator,
+    NMLGenerator,
+    create_generators,
+    sanitize_filename,
+)
 
 
 @pytest.fixture
@@ -52,4 +58,65 @@ def test_nml_generator(sample_config, sample_playlist):
     assert generator.file_extension == ".nml"
 
 
+def test_sanitize_filename():
+    """Test playlist names are made safe for filenames."""
+    assert sanitize_filename('House: "Best" of 2024/25?') == "House_ _Best_ of 2024_25_"
+    assert sanitize_filename("  .hidden. ") == "hidden"
+    assert sanitize_filename("...") == "playlist"
+
+
+def test_create_generators():
+    """Test generators are created for the configured output format."""
+    generators = create_generators(ConversionConfig(output_format="m3u8"))
+    assert [type(g) for g in generators] == [M3U8Generator]
+
+    generators = create_generators(ConversionConfig(output_format="all"))
+    assert [type(g) for g in generators] == [NMLGenerator, M3UGenerator, M3U8Generator]
+
+
+def test_file_exists_lists_each_folder_once(sample_config, tmp_path):
+    """Test the folder-listing file existence check."""
+    (tmp_path / "present.mp3").write_bytes(b"")
+    generator = NMLGenerator(sample_config)
+    listings = {}
+
+    assert generator._file_exists(str(tmp_path / "present.mp3"), listings)
+    assert not generator._file_exists(str(tmp_path / "missing.mp3"), listings)
+    assert not generator._file_exists(str(tmp_path / "nope" / "a.mp3"), listings)
+    assert listings[str(tmp_path)] == {"present.mp3"}
+
+
+def test_nml_output_is_multiline(sample_config, sample_playlist, tmp_path):
+    """Test NML output is written one element per line."""
+    generator = NMLGenerator(sample_config)
+    output_file = tmp_path / "test.nml"
+
+    result = generator.generate(sample_playlist, output_file)
+
+    assert result.success
+    content = output_file.read_bytes()
+    assert b"\n" in content
+    assert b"\\n" not in content
+    assert b"\n\n" not in content
+    assert content.endswith(b"\n")
+
+
+def test_nml_escapes_attribute_whitespace(sample_config, tmp_path):
+    """Test newlines and tabs in attribute values survive as references."""
+    track = Track(
+        title="Line\nbreak\ttab",
+        artist="Artist",
+        file_path=Path("Music/test.mp3"),
+    )
+    playlist = Playlist(name="Test Playlist", tracks=[track])
+    output_file = tmp_path / "test.nml"
+
+    result = NMLGenerator(sample_config).generate(playlist, output_file)
+
+    assert result.success
+    content = output_file.read_bytes()
+    assert b'TITLE="Line&#10;break&#9;tab"' in content
+    assert content.endswith(b"</NML>\n")
+
+
 # Add more tests as needed...
@@ -31,4 +31,23 @@ def test_parser_initialization():
     assert parser._playlists_cache == []
 
 
+def test_parse_drops_extracted_data(tmp_path):
+    """Test re-parsing forgets tracks extracted from the previous file."""
+    parser = RekordboxParser(tmp_path / "export.pdb")
+    track = Track(title="Old", artist="Old", file_path=Path("old.mp3"))
+    parser._tracks_cache = {1: track}
+    parser._minimal_tracks_cache = {1: track}
+    parser._full_tracks_by_path = {"old.mp3": track}
+    parser._lookup_tables_cache = {"artists": {1: "Old"}}
+
+    parser.close()
+    assert parser._tracks_cache == {1: track}
+
+    parser.parse()
+    assert parser._tracks_cache == {}
+    assert parser._minimal_tracks_cache == {}
+    assert parser._full_tracks_by_path is None
+    assert parser._lookup_tables_cache == {}
+
+
 # Add more tests as needed...